@@ -576,7 +576,7 @@ class CmdResource(CharacterLookupMixin, MuxCommand):
                     if not disbursements:
                         continue
                     for entry in disbursements.values():
-                        table.add_row(obj.name, entry["name"], f"d{entry['die_size']}", entry["count"])
+                        table.add_row(obj.name, entry.name, f"d{entry.die_size}", entry.count)
                         total_entries += 1
                 if total_entries:
                     self.msg("Recurring disbursements for all targets:")
@@ -635,7 +635,7 @@ class CmdResource(CharacterLookupMixin, MuxCommand):
             entry = set_resource_disbursement(target, name_part, die_size, count)
             if entry:
                 self.msg(
-                    f"Set due {entry['name']} d{entry['die_size']} for {target.name} to {entry['count']} (will receive {entry['count']}x d{entry['die_size']})."
+                    f"Set due {entry.name} d{entry.die_size} for {target.name} to {entry.count} (will receive {entry.count}x d{entry.die_size})."
                 )
             else:
                 self.msg(f"Removed due {name_part} d{die_size} for {target.name}.")
@@ -646,7 +646,7 @@ class CmdResource(CharacterLookupMixin, MuxCommand):
             entry = increment_resource_disbursement(target, name_part, die_size, count)
             if entry:
                 self.msg(
-                    f"Adjusted due {entry['name']} d{entry['die_size']} for {target.name} to {entry['count']} (will receive {entry['count']}x d{entry['die_size']})."
+                    f"Adjusted due {entry.name} d{entry.die_size} for {target.name} to {entry.count} (will receive {entry.count}x d{entry.die_size})."
                 )
             else:
                 self.msg(f"Cleared due {name_part} d{die_size} for {target.name}.")
@@ -666,7 +666,7 @@ class CmdResource(CharacterLookupMixin, MuxCommand):
 
         table = EvTable("|wName|n", "|wDie|n", "|wCount|n", border="header")
         for entry in disbursements.values():
-            table.add_row(entry["name"], f"d{entry['die_size']}", entry["count"])
+            table.add_row(entry.name, f"d{entry.die_size}", entry.count)
         self.msg(f"Recurring disbursements for {target.name}:")
         self.msg(table)
 
@@ -710,11 +710,11 @@ class CmdResource(CharacterLookupMixin, MuxCommand):
                 continue
             applied = []
             for entry in disbursements.values():
-                count = entry.get("count", 0)
+                count = entry.count
                 if count <= 0:
                     continue
-                name = entry["name"]
-                die_size = entry["die_size"]
+                name = entry.name
+                die_size = entry.die_size
                 for _ in range(count):
                     try:
                         if hasattr(target, "add_resource"):
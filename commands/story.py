@@ -156,6 +156,11 @@ class CmdStory(MuxCommand):
         all_plots = StoryManager.get_all_plots()
         plot_map = {s.db.story_id: s.db.title for s in all_plots}
         
+        # Fetch every chapter's updates in one pass, grouped by chapter
+        updates_by_chapter = StoryManager.get_updates_by_chapter(
+            chapter.db.story_id for chapter in all_chapters
+        )
+        
         # Display hierarchically
         for book_title, chapters in book_structure.items():
             lines.append(f"|yBook: {book_title}|n")
@@ -165,7 +170,7 @@ class CmdStory(MuxCommand):
                 lines.append(f"  |wChapter {chapter.db.story_id}: {chapter.db.title}{current_marker}|n")
                 
                 # Show updates for this chapter with plot tags
-                updates = StoryManager.get_chapter_updates(chapter.db.story_id)
+                updates = updates_by_chapter.get(chapter.db.story_id, [])
                 if updates:
                     for update in updates[:10]:  # Show first 10
                         book_scoped = StoryManager.get_book_scoped_number(update.db.story_id, book_title)
@@ -189,7 +194,7 @@ class CmdStory(MuxCommand):
             lines.append("")  # Space between books
         
         # Summary
-        total_updates = len(StoryManager.get_recent_updates(limit=999))
+        total_updates = StoryManager.get_update_count()
         current_pos = f"Chapter {current_chapter.db.story_id}" if current_chapter else "No current chapter"
         lines.append(f"|wSummary:|n {len(all_chapters)} chapters, {total_updates} story updates")
         lines.append(f"Currently at: |y{current_pos}|n")
@@ -321,7 +326,7 @@ class CmdStory(MuxCommand):
         global_id = update.db.story_id
         book_scoped_num = StoryManager.get_book_scoped_number(global_id, book_title)
         
-        update.delete()
+        StoryManager.delete_story_update(update)
         
         if book_scoped_num and book_title and book_title != "Untitled Book":
             self.msg(f"Deleted story update #{book_scoped_num} from '{book_title}': |r{title}|n")
@@ -724,8 +729,9 @@ class CmdChapter(MuxCommand):
         lines.append(f"Chapter {current_chapter.db.story_id}: |y{current_chapter.db.title}|n")
         
         # Show time - chapter-specific if set, otherwise global narrative time
-        if hasattr(current_chapter.db, 'chapter_time') and current_chapter.db.chapter_time:
-            lines.append(f"Chapter Time: |g{current_chapter.db.chapter_time}|n")
+        chapter_time = current_chapter.attributes.get('chapter_time')
+        if chapter_time:
+            lines.append(f"Chapter Time: |g{chapter_time}|n")
         else:
             time_tracker = NarrativeTime.get_instance()
             lines.append(f"Global Time: |g{time_tracker.current_time}|n")
@@ -781,8 +787,9 @@ class CmdChapter(MuxCommand):
             lines.append("|g[CURRENT CHAPTER]|n")
             
         # Show time - chapter-specific if set, otherwise global for current chapter
-        if hasattr(chapter.db, 'chapter_time') and chapter.db.chapter_time:
-            lines.append(f"Chapter Time: |g{chapter.db.chapter_time}|n")
+        chapter_time = chapter.attributes.get('chapter_time')
+        if chapter_time:
+            lines.append(f"Chapter Time: |g{chapter_time}|n")
         elif chapter.db.is_current:
             time_tracker = NarrativeTime.get_instance()
             lines.append(f"Global Time: |g{time_tracker.current_time}|n")
@@ -905,7 +912,7 @@ class CmdChapter(MuxCommand):
             self.msg(f"Chapter #{chapter_id} not found.")
             return
             
-        target_chapter.db.book_title = book_title
+        StoryManager.set_chapter_book(target_chapter, book_title)
         self.msg(f"Set chapter #{chapter_id} book to: |c{book_title}|n")
     
     def _set_chapter_time(self):
@@ -971,7 +978,7 @@ class CmdChapter(MuxCommand):
         for chapter in all_chapters:
             current_marker = "|gYes|n" if chapter.db.is_current else "No"
             book = chapter.db.book_title or "-"
-            chapter_time = getattr(chapter.db, 'chapter_time', '') or "-"
+            chapter_time = chapter.attributes.get('chapter_time') or "-"
             
             table.add_row(chapter.db.story_id, chapter.db.title, book, chapter_time, current_marker)
             
@@ -30,7 +30,10 @@ def at_server_start():
     This is called every time the server starts up, regardless of
     how it was shut down.
     """
-    pass
+    # Make sure older story elements carry the tags used for lookups
+    from utils.story_manager import StoryManager
+
+    StoryManager.ensure_story_tags()
 
 
 def at_server_stop():
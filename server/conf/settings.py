@@ -63,6 +63,10 @@ WEB_PROFILE_DOMAIN = 'localhost:4001'  # Development setting
 # Enable debug mode for development
 DEBUG = True
 
+# Spool uploads larger than 256KB (e.g. character images) to a temp file
+# instead of holding them in memory for the whole request
+FILE_UPLOAD_MAX_MEMORY_SIZE = 256 * 1024
+
 ######################################################################
 # Text processing settings
 ######################################################################
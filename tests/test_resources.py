@@ -212,6 +212,12 @@ class TestResources(EvenniaTest):
         name = get_unique_resource_name("new", self.char1.char_resources)
         self.assertEqual(name, "new")  # Should use original name
         
+        # Test precomputed name sets and keeping numeric suffixes
+        name = get_unique_resource_name("gold_2", {"gold", "gold_2"}, strip_number_suffix=False)
+        self.assertEqual(name, "gold_2_1")
+        name = get_unique_resource_name("gold_2", frozenset({"gold"}))
+        self.assertEqual(name, "gold_1")
+        
         # Test resource owner validation
         obj = self.obj1  # Regular object without resources
         self.assertFalse(validate_resource_owner(obj))
@@ -222,11 +228,11 @@ class TestResources(EvenniaTest):
         disbursements = get_resource_disbursements(self.char1)
         self.assertEqual(len(disbursements), 1)
         key = next(iter(disbursements))
-        self.assertEqual(disbursements[key]["count"], 2)
+        self.assertEqual(disbursements[key].count, 2)
 
         increment_resource_disbursement(self.char1, "bonus", 6, -1)
         disbursements = get_resource_disbursements(self.char1)
-        self.assertEqual(disbursements[key]["count"], 1)
+        self.assertEqual(disbursements[key].count, 1)
 
         increment_resource_disbursement(self.char1, "bonus", 6, -1)
         self.assertEqual(get_resource_disbursements(self.char1), {})
@@ -254,7 +260,7 @@ class TestResources(EvenniaTest):
         entries = get_resource_disbursements(target)
         self.assertTrue(entries)
         entry = next(iter(entries.values()))
-        self.assertEqual(entry["count"], 2)
+        self.assertEqual(entry.count, 2)
 
         # Increment queued amount
         self.cmd.switches = ["due", "add"]
@@ -262,7 +268,7 @@ class TestResources(EvenniaTest):
         self.cmd.func()
         entries = get_resource_disbursements(target)
         entry = next(iter(entries.values()))
-        self.assertEqual(entry["count"], 3)
+        self.assertEqual(entry.count, 3)
 
         # Apply disbursements (individual target)
         self.cmd.switches = ["disburse"]
@@ -288,7 +294,7 @@ class TestResources(EvenniaTest):
         disbursements = get_resource_disbursements(target)
         self.assertTrue(disbursements)
         entry = next(iter(disbursements.values()))
-        self.assertEqual(entry["count"], 3)
+        self.assertEqual(entry.count, 3)
         
         # Clear the recurring config manually
         self.cmd.switches = ["due", "clear"]
@@ -34,3 +34,30 @@ def test_record_entry(account, room):
     scene = scene_logger.start_scene(room, owner=room, chapter=None)
     scene_logger.record_entry(scene, SceneEntry.EntryType.EMIT, text="|wHello|n", text_plain="Hello")
     assert SceneEntry.objects.filter(scene=scene).count() == 1
+
+
+def test_record_entries_bulk(account, room):
+    scene = scene_logger.start_scene(room, owner=room, chapter=None)
+    scene_logger.record_entry(scene, SceneEntry.EntryType.EMIT, text="First", text_plain="First")
+    scene_logger.record_entries(
+        scene,
+        [
+            {"entry_type": SceneEntry.EntryType.POSE, "text": "|wSecond|n"},
+            {"entry_type": SceneEntry.EntryType.SAY, "text": "Third", "text_plain": "Third"},
+        ],
+    )
+    sequences = list(SceneEntry.objects.filter(scene=scene).values_list("sequence", flat=True))
+    assert sequences == [1, 2, 3]
+
+
+def test_scene_allows_viewer_bulk(account, room):
+    private_scene = scene_logger.start_scene(room, owner=room, chapter=None)
+    event_scene = scene_logger.start_scene(
+        room, owner=room, chapter=None, visibility=SceneLog.Visibility.EVENT
+    )
+    allowed = scene_logger.scene_allows_viewer_bulk([private_scene, event_scene], account)
+    assert allowed == {
+        private_scene.pk: scene_logger.scene_allows_viewer(private_scene, account),
+        event_scene.pk: True,
+    }
+    assert allowed[private_scene.pk] is False
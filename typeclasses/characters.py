@@ -144,6 +144,14 @@ class Character(ObjectParent, DefaultCharacter):
     def remove_worn_item(self, item):
         """Stop tracking an item as worn."""
         return worn_utils.remove_worn_item(self, item)
+
+    def add_worn_items(self, items):
+        """Track several items as worn with a single write."""
+        return worn_utils.bulk_add_worn_items(self, items)
+
+    def remove_worn_items(self, items):
+        """Stop tracking several items as worn with a single write."""
+        return worn_utils.bulk_remove_worn_items(self, items)
         
     def at_object_creation(self):
         """
@@ -30,7 +30,8 @@ class StoryElement(DefaultScript):
         title (str): Title of the plot/chapter/update
         content (str): Content text (for updates only)
         description (str): Description (for plots only)
-        update_ids (list): List of update IDs (for plots only)
+        update_ids (set): Set of update IDs (for plots only)
+        plot_ids (set): Set of plot IDs this update belongs to (for updates only)
         book_title (str): Book this belongs to (for chapters)
         parent_id (int): Chapter ID (for updates only)
         order (int): Order within parent/sequence
@@ -50,7 +51,8 @@ class StoryElement(DefaultScript):
         self.db.title = ""
         self.db.content = ""  # For updates only
         self.db.description = ""  # For plots only
-        self.db.update_ids = []  # For plots - which updates they contain (list)
+        self.db.update_ids = set()  # For plots - which updates they contain
+        self.db.plot_ids = set()  # For updates - which plots they belong to
         
         # Hierarchy info
         self.db.book_title = ""  # For chapters - which book they belong to
@@ -105,27 +107,71 @@ class StoryElement(DefaultScript):
     @classmethod
     def get_current_chapter(cls):
         """Get the currently active chapter."""
-        scripts = search_script("", typeclass="typeclasses.story.StoryElement")
-        current = [s for s in scripts if s.db.story_type == "chapter" and s.db.is_current]
-        return current[0] if current else None
+        # StoryManager finds it through the indexed current-chapter tag
+        from utils.story_manager import StoryManager
+        return StoryManager.get_current_chapter()
         
     @classmethod
     def get_all_chapters(cls):
         """Get all chapters, ordered by sequence."""
         scripts = search_script("", typeclass="typeclasses.story.StoryElement")
-        chapters = [s for s in scripts if s.db.story_type == "chapter"]
-        return sorted(chapters, key=lambda x: x.db.order)
+        chapters = [s for s in scripts if s.attributes.get("story_type") == "chapter"]
+        return sorted(chapters, key=lambda x: x.attributes.get("order", default=0))
         
     @classmethod
     def get_chapter_updates(cls, chapter_id):
         """Get all story updates for a specific chapter."""
         scripts = search_script("", typeclass="typeclasses.story.StoryElement")
-        updates = [s for s in scripts if s.db.story_type == "update" and s.db.parent_id == chapter_id]
-        return sorted(updates, key=lambda x: x.db.order)
+        updates = [
+            s for s in scripts
+            if s.attributes.get("story_type") == "update" and s.attributes.get("parent_id") == chapter_id
+        ]
+        return sorted(updates, key=lambda x: x.attributes.get("order", default=0))
         
     @classmethod
     def get_recent_updates(cls, limit=5):
         """Get the most recent story updates across all chapters."""
         scripts = search_script("", typeclass="typeclasses.story.StoryElement")
-        updates = [s for s in scripts if s.db.story_type == "update"]
-        return sorted(updates, key=lambda x: x.db.timestamp, reverse=True)[:limit] 
\ No newline at end of file
+        updates = [s for s in scripts if s.attributes.get("story_type") == "update"]
+        return sorted(updates, key=lambda x: x.attributes.get("timestamp"), reverse=True)[:limit] 
+
+
+class StorySystemState(DefaultScript):
+    """
+    Singleton script holding story system bookkeeping.
+    
+    Stores monotonic ID counters so new plots, chapters and story updates
+    don't need to scan every existing element to find the next free number.
+    
+    Attributes:
+        next_plot_id (int): Next plot ID to hand out
+        next_chapter_id (int): Next chapter ID to hand out
+        next_update_id (int): Next story update ID to hand out
+        tags_version (int): Version of the lookup tags applied to
+            existing story elements
+    """
+    
+    def at_script_creation(self):
+        """Set up the story system state tracker."""
+        super().at_script_creation()
+        
+        # Counters are seeded lazily from existing elements on first use
+        self.db.next_plot_id = None
+        self.db.next_chapter_id = None
+        self.db.next_update_id = None
+        
+        # Make this a persistent singleton
+        self.key = "story_system_state"
+        self.interval = -1
+        self.persistent = True
+        
+    @classmethod
+    def get_instance(cls):
+        """Get or create the singleton StorySystemState instance."""
+        existing = search_script("story_system_state", typeclass=cls)
+        if existing:
+            return existing[0]
+        else:
+            # Create new instance
+            from evennia import create_script
+            return create_script(cls, key="story_system_state")
@@ -1,7 +1,7 @@
 """
 Utility functions for character setup and initialization.
 """
-from typing import List, Tuple, Optional, Any
+from typing import List, Sequence, Tuple, Optional, Any
 from .trait_definitions import TraitDefinition, ATTRIBUTES, SKILLS, DISTINCTIONS
 from evennia.contrib.rpg.traits import TraitHandler
 
@@ -12,7 +12,7 @@ def initialize_plot_points(character: Any, force: bool) -> Optional[str]:
 
 def initialize_trait_group(
     character: Any,
-    trait_definitions: List[TraitDefinition],
+    trait_definitions: Sequence[TraitDefinition],
     handler_name: str,
     force: bool
 ) -> List[str]:
@@ -8,6 +8,7 @@ from evennia.accounts.models import AccountDB
 from datetime import datetime, timedelta
 from typeclasses.requests import Request, VALID_STATUSES, DEFAULT_CATEGORIES
 
+
 class RequestManager:
     """Handles request workflow logic."""
     
@@ -51,11 +52,7 @@ class RequestManager:
                 continue
             if not account.is_connected:
                 continue
-            if not (
-                account.permissions.check("Admin")
-                or account.permissions.check("Builder")
-                or account.permissions.check("Developer")
-            ):
+            if not account.check_permstring("Builder"):
                 continue
             if getattr(account.db, "request_notify_mute", False):
                 continue
@@ -105,19 +102,14 @@ class RequestManager:
     @classmethod
     def get_next_id(cls):
         """Get the next available request ID."""
-        requests = ScriptDB.objects.filter(db_typeclass_path__contains="requests.Request")
-        if not requests.exists():
-            return 1
-            
-        max_id = 0
-        for request in requests:
-            try:
-                if request.db.id and request.db.id > max_id:
-                    max_id = request.db.id
-            except AttributeError:
-                continue
-                
-        return max_id + 1
+        # Request keys are "Request-<id>", so the IDs can be read from the
+        # keys alone without loading each request or its attributes
+        keys = ScriptDB.objects.filter(
+            db_typeclass_path__contains="requests.Request",
+            db_key__startswith="Request-",
+        ).values_list("db_key", flat=True)
+        suffixes = (key[len("Request-"):] for key in keys)
+        return max((int(suffix) for suffix in suffixes if suffix.isdigit()), default=0) + 1
         
     @classmethod
     def add_comment(cls, request, author, text):
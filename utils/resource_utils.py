@@ -3,61 +3,76 @@ Resource utility functions.
 """
 
 import re
-from copy import deepcopy
+from dataclasses import dataclass
 
 
 RESOURCE_DUE_ATTR = "resource_disbursements"
 RESOURCE_DUE_CATEGORY = "resources"
 
+_NUMBER_SUFFIX_RE = re.compile(r'[_\s]+\d+$')
 
-def get_unique_resource_name(name, existing_resources, caller=None):
+
+@dataclass(slots=True)
+class DueEntry:
+    """A queued recurring resource disbursement.
+
+    Attributes:
+        name (str): Display name of the resource
+        die_size (int): Die size of each resource granted
+        count (int): Number of resources granted per disbursement
+    """
+    name: str
+    die_size: int
+    count: int
+
+
+def get_unique_resource_name(name, existing_resources, caller=None, *, strip_number_suffix=True):
     """Get a unique name for a resource, appending a number if needed.
     
     Args:
         name (str): Base name for the resource
-        existing_resources (dict or TraitHandler): Existing resources to check against
+        existing_resources (dict, set or TraitHandler): Existing resources to check
+            against. Passing a set/frozenset of names skips the handler lookup.
         caller (optional): Caller to notify about name changes
+        strip_number_suffix (bool): Whether to strip an existing numeric suffix
+            (e.g. "gold_2") before checking
         
     Returns:
         str: A unique name for the resource
     """
     # First try to strip any existing number suffix
-    base_name = re.sub(r'[_\s]+\d+$', '', name)
+    base_name = _NUMBER_SUFFIX_RE.sub('', name) if strip_number_suffix else name
     
-    # If it's a TraitHandler, check if the base name exists
-    if hasattr(existing_resources, 'get'):
-        if not existing_resources.get(base_name):
-            if base_name != name and caller:
-                caller.msg(f"Simplified resource name from '{name}' to '{base_name}'.")
-            return base_name
-            
-        # Find the next available number
-        counter = 1
-        while existing_resources.get(f"{base_name}_{counter}"):
-            counter += 1
-            
-        new_name = f"{base_name}_{counter}"
-        if new_name != name and caller:
-            caller.msg(f"Resource name '{base_name}' already exists, using '{new_name}' instead.")
-            
-        return new_name
+    # Snapshot the existing names once so probing doesn't hit the handler each step
+    if isinstance(existing_resources, (set, frozenset)):
+        existing = existing_resources
     else:
-        # Handle plain dictionaries (for backward compatibility)
-        if base_name not in existing_resources:
-            if base_name != name and caller:
-                caller.msg(f"Simplified resource name from '{name}' to '{base_name}'.")
-            return base_name
-            
-        # Find the next available number
-        counter = 1
-        while f"{base_name}_{counter}" in existing_resources:
-            counter += 1
-            
-        new_name = f"{base_name}_{counter}"
-        if new_name != name and caller:
-            caller.msg(f"Resource name '{base_name}' already exists, using '{new_name}' instead.")
-            
-        return new_name
+        existing = _existing_resource_names(existing_resources)
+    
+    if base_name not in existing:
+        if base_name != name and caller:
+            caller.msg(f"Simplified resource name from '{name}' to '{base_name}'.")
+        return base_name
+        
+    # Find the next available number
+    counter = 1
+    while f"{base_name}_{counter}" in existing:
+        counter += 1
+        
+    new_name = f"{base_name}_{counter}"
+    if new_name != name and caller:
+        caller.msg(f"Resource name '{base_name}' already exists, using '{new_name}' instead.")
+        
+    return new_name
+
+
+def _existing_resource_names(existing_resources):
+    """Return the set of names held by a TraitHandler or plain container."""
+    if hasattr(existing_resources, 'all'):
+        # TraitHandler.all() returns the list of trait keys
+        return set(existing_resources.all())
+    # Plain dictionaries/iterables (for backward compatibility)
+    return set(existing_resources)
 
 
 def validate_resource_owner(obj, caller=None):
@@ -102,34 +117,53 @@ def _make_due_key(name, die_size):
     """Create a normalized key for a due resource entry."""
     if name is None:
         return None
-    normalized_name = re.sub(r"\s+", " ", name.strip()).lower()
-    return f"{normalized_name}|{die_size}"
+    # str.split() with no arguments strips and collapses whitespace in one pass
+    return f"{' '.join(name.split()).lower()}|{die_size}"
 
 
 def get_resource_disbursements(obj):
-    """Return a copy of the queued resource disbursements for an object."""
+    """Return the queued resource disbursements for an object.
+    
+    Disbursements are stored as a packed list of ``(name, die_size, count)``
+    tuples. Older dict-of-dicts payloads are read transparently and rewritten
+    in the packed form.
+    
+    Returns:
+        dict: Normalized key -> DueEntry. Entries are freshly built, so
+            callers may modify them without touching stored state.
+    """
     data = obj.attributes.get(
         RESOURCE_DUE_ATTR,
-        default={},
+        default=None,
         category=RESOURCE_DUE_CATEGORY,
     )
     if not data:
         return {}
-    # Ensure we always return a copy so callers don't mutate stored state.
-    return deepcopy(data)
+    if hasattr(data, "items"):
+        # Legacy payload: {key: {"name", "die_size", "count"}}
+        disbursements = {
+            key: DueEntry(value["name"], value["die_size"], value.get("count", 0))
+            for key, value in data.items()
+        }
+        save_resource_disbursements(obj, disbursements)
+        return disbursements
+    return {
+        _make_due_key(name, die_size): DueEntry(name, die_size, count)
+        for name, die_size, count in data
+    }
 
 
 def save_resource_disbursements(obj, disbursements):
     """Persist resource disbursement data, removing the attribute if empty."""
-    cleaned = {
-        key: value
-        for key, value in (disbursements or {}).items()
-        if value.get("count", 0) > 0
-    }
-    if cleaned:
+    packed = [
+        (entry.name, entry.die_size, entry.count)
+        for entry in (disbursements or {}).values()
+        if entry.count > 0
+    ]
+    if packed:
         obj.attributes.add(
             RESOURCE_DUE_ATTR,
-            cleaned,
+            packed,
             category=RESOURCE_DUE_CATEGORY,
         )
     else:
@@ -141,43 +175,50 @@ def save_resource_disbursements(obj, disbursements):
 
 
 def set_resource_disbursement(obj, name, die_size, count):
-    """Set the queued count for a specific resource disbursement."""
+    """Set the queued count for a specific resource disbursement.
+    
+    Returns:
+        DueEntry or None: The updated entry, or None if it was removed
+    """
     if count < 0:
         raise ValueError("Count cannot be negative.")
     key = _make_due_key(name, die_size)
     if key is None:
         raise ValueError("Resource name cannot be empty.")
     disbursements = get_resource_disbursements(obj)
+    current = disbursements.get(key)
     if count == 0:
         disbursements.pop(key, None)
+    elif current:
+        # Reuse the loaded entry rather than allocating a replacement
+        current.name = name.strip()
+        current.die_size = die_size
+        current.count = count
     else:
-        disbursements[key] = {
-            "name": name.strip(),
-            "die_size": die_size,
-            "count": count,
-        }
+        disbursements[key] = DueEntry(name.strip(), die_size, count)
     save_resource_disbursements(obj, disbursements)
     return disbursements.get(key)
 
 
 def increment_resource_disbursement(obj, name, die_size, delta):
-    """Adjust the queued count for a resource disbursement by delta."""
+    """Adjust the queued count for a resource disbursement by delta.
+    
+    Returns:
+        DueEntry or None: The updated entry, or None if it was removed
+    """
     disbursements = get_resource_disbursements(obj)
     key = _make_due_key(name, die_size)
     if key is None:
         raise ValueError("Resource name cannot be empty.")
-    current = disbursements.get(key, {"count": 0})
-    new_count = current.get("count", 0) + delta
-    if new_count < 0:
-        new_count = 0
+    current = disbursements.get(key)
+    new_count = max((current.count if current else 0) + delta, 0)
     if new_count == 0:
         disbursements.pop(key, None)
+    elif current:
+        # The entry is already our private copy, so update it in place
+        current.count = new_count
     else:
-        disbursements[key] = {
-            "name": current.get("name", name.strip()),
-            "die_size": current.get("die_size", die_size),
-            "count": new_count,
-        }
+        disbursements[key] = DueEntry(name.strip(), die_size, new_count)
     save_resource_disbursements(obj, disbursements)
     return disbursements.get(key)
 
@@ -9,7 +9,10 @@ relational data that powers searching and web presentation.
 from __future__ import annotations
 
 import logging
+import operator
 from dataclasses import dataclass
+from datetime import datetime
+from functools import reduce
 from typing import Iterable, Optional
 
 from django.db import models, transaction
@@ -18,8 +21,15 @@ from django.utils import timezone
 from evennia import create_script
 from evennia.accounts.models import AccountDB
 from evennia.objects.models import ObjectDB
+from evennia.scripts.models import ScriptDB
 from evennia.utils.search import search_script
 
+try:
+    from evennia.utils.ansi import strip_ansi as _evennia_strip_ansi
+except Exception:  # pragma: no cover
+    def _evennia_strip_ansi(value: str) -> str:
+        return value
+
 from web.scenes.models import SceneEntry, SceneLog, SceneParticipant, SceneParticipantSegment
 
 logger = logging.getLogger(__name__)
@@ -44,12 +54,11 @@ class SceneContext:
 def _resolve_account(owner) -> Optional[AccountDB]:
     """Best-effort conversion of any object into its owning account."""
 
-    if isinstance(owner, AccountDB):
-        return owner
+    # Puppeted characters are the common case, so check their account first
     account = getattr(owner, "account", None)
-    if isinstance(account, AccountDB):
-        return account
-    return None
+    if account is not None:
+        return account if isinstance(account, AccountDB) else None
+    return owner if isinstance(owner, AccountDB) else None
 
 
 def get_room_scene(room: Optional[ObjectDB]) -> Optional[SceneContext]:
@@ -68,17 +77,18 @@ def get_room_scene(room: Optional[ObjectDB]) -> Optional[SceneContext]:
     return SceneContext(scene=scene, room=room)
 
 
+def _scene_scripts(room: ObjectDB, scene: SceneLog):
+    """Queryset of the scene tracker scripts for this scene on the room."""
+
+    return ScriptDB.objects.filter(db_obj=room, db_typeclass_path=SCENE_SCRIPT_TYPECLASS, db_key=str(scene.pk))
+
+
 def attach_scene_script(room: ObjectDB, scene: SceneLog):
     """Ensure the scene tracker script is attached to the room."""
 
     # Search for existing scene tracker scripts on this room
-    existing = [
-        script for script in room.scripts.all()
-        if script.typeclass_path == SCENE_SCRIPT_TYPECLASS and script.key == str(scene.pk)
-    ]
-    if existing:
-        script = existing[0]
-    else:
+    script = _scene_scripts(room, scene).first()
+    if not script:
         script = create_script(SCENE_SCRIPT_TYPECLASS, key=str(scene.pk), obj=room)
     script.db.scene_id = scene.pk
     script.db.started_at = timezone.now()
@@ -109,42 +119,66 @@ def start_scene(
         if organisations:
             scene.organisations.add(*organisations)
         attach_scene_script(room, scene)
-        register_initial_participants(scene, room)
+        register_initial_participants(scene, room, now=scene.created_at)
     logger.info("Scene %s started in room %s", scene.pk, room)
     return scene
 
 
-def register_initial_participants(scene: SceneLog, room: ObjectDB):
+def register_initial_participants(scene: SceneLog, room: ObjectDB, *, now: Optional[datetime] = None):
     """Register all present puppeted characters as scene participants."""
 
-    now = timezone.now()
+    now = now or timezone.now()
+    accounts = {}
     for obj in room.contents:
         account = _resolve_account(obj)
-        if not account:
-            continue
-        participant, created = SceneParticipant.objects.get_or_create(
-            scene=scene,
-            character_id=obj.id,
-            defaults={
-                "account_id": account.id,
-                "first_joined_at": now,
-                "is_present": True,
-            },
+        if account:
+            accounts[obj.id] = account
+    if not accounts:
+        return
+
+    existing = dict(
+        SceneParticipant.objects.filter(scene=scene, character_id__in=accounts).values_list(
+            "character_id", "is_present"
+        )
+    )
+    new_ids = [char_id for char_id in accounts if char_id not in existing]
+    rejoin_ids = [char_id for char_id, present in existing.items() if not present]
+
+    if new_ids:
+        SceneParticipant.objects.bulk_create(
+            [
+                SceneParticipant(
+                    scene=scene,
+                    character_id=char_id,
+                    account_id=accounts[char_id].id,
+                    first_joined_at=now,
+                    is_present=True,
+                )
+                for char_id in new_ids
+            ]
+        )
+    if rejoin_ids:
+        SceneParticipant.objects.filter(scene=scene, character_id__in=rejoin_ids).update(
+            is_present=True, last_left_at=None
+        )
+
+    # Open a segment for everyone who has just (re)joined
+    joined_ids = new_ids + rejoin_ids
+    if joined_ids:
+        participant_ids = SceneParticipant.objects.filter(
+            scene=scene, character_id__in=joined_ids
+        ).values_list("id", flat=True)
+        SceneParticipantSegment.objects.bulk_create(
+            [SceneParticipantSegment(participant_id=pk, joined_at=now) for pk in participant_ids]
         )
-        if created:
-            SceneParticipantSegment.objects.create(participant=participant, joined_at=now)
-        else:
-            if not participant.is_present:
-                participant.is_present = True
-                participant.last_left_at = None
-                participant.save(update_fields=["is_present", "last_left_at"])
-                SceneParticipantSegment.objects.create(participant=participant, joined_at=now)
 
 
-def record_participant_join(scene: SceneLog, character: ObjectDB, account: AccountDB):
+def record_participant_join(
+    scene: SceneLog, character: ObjectDB, account: AccountDB, *, now: Optional[datetime] = None
+):
     """Mark a character as having joined an active scene."""
 
-    now = timezone.now()
+    now = now or timezone.now()
     participant, created = SceneParticipant.objects.get_or_create(
         scene=scene,
         character_id=character.id,
@@ -157,31 +191,33 @@ def record_participant_join(scene: SceneLog, character: ObjectDB, account: Accou
     if created:
         SceneParticipantSegment.objects.create(participant=participant, joined_at=now)
     else:
-        if participant.account_id != account.id:
-            participant.account_id = account.id
-        participant.is_present = True
-        participant.last_left_at = None
-        participant.save(update_fields=["account_id", "is_present", "last_left_at"])
+        # Scene models have no save signal handlers, so a queryset update is safe
+        SceneParticipant.objects.filter(pk=participant.pk).update(
+            account_id=account.id, is_present=True, last_left_at=None
+        )
         SceneParticipantSegment.objects.create(participant=participant, joined_at=now)
 
 
-def record_participant_depart(scene: SceneLog, character: ObjectDB):
+def record_participant_depart(scene: SceneLog, character: ObjectDB, *, now: Optional[datetime] = None):
     """Mark a character as having left the scene."""
 
-    try:
-        participant = SceneParticipant.objects.get(scene=scene, character_id=character.id)
-    except SceneParticipant.DoesNotExist:
-        return
-    if not participant.is_present:
+    now = now or timezone.now()
+    # The update's row count doubles as the "was present" check.
+    # Scene models have no save signal handlers, so queryset updates are safe.
+    updated = SceneParticipant.objects.filter(
+        scene=scene, character_id=character.id, is_present=True
+    ).update(is_present=False, last_left_at=now)
+    if not updated:
         return
-    now = timezone.now()
-    participant.is_present = False
-    participant.last_left_at = now
-    participant.save(update_fields=["is_present", "last_left_at"])
-    segment = participant.segments.filter(left_at__isnull=True).order_by("-joined_at").first()
-    if segment:
-        segment.left_at = now
-        segment.save(update_fields=["left_at"])
+    SceneParticipantSegment.objects.filter(
+        participant__scene=scene, participant__character_id=character.id, left_at__isnull=True
+    ).update(left_at=now)
+
+
+def _last_sequence(scene: SceneLog) -> int:
+    """Return the highest entry sequence recorded for the scene (0 if none)."""
+
+    return SceneEntry.objects.filter(scene=scene).aggregate(last=models.Max("sequence"))["last"] or 0
 
 
 def record_entry(
@@ -196,10 +232,7 @@ def record_entry(
 
     if text_plain is None:
         text_plain = strip_ansi(text)
-    sequence = (
-        SceneEntry.objects.filter(scene=scene).order_by("-sequence").values_list("sequence", flat=True).first()
-        or 0
-    ) + 1
+    sequence = _last_sequence(scene) + 1
     SceneEntry.objects.create(
         scene=scene,
         sequence=sequence,
@@ -210,15 +243,37 @@ def record_entry(
     )
 
 
+def record_entries(scene: SceneLog, entries: Iterable[dict]):
+    """Persist several log entries within the scene in a single insert.
+
+    Each entry is a mapping accepting the same keys as :func:`record_entry`:
+    ``entry_type`` and ``text`` (required), plus optional ``actor`` and
+    ``text_plain``. Sequences are assigned in iteration order.
+    """
+
+    start_sequence = _last_sequence(scene) + 1
+    objs = [
+        SceneEntry(
+            scene=scene,
+            sequence=start_sequence + index,
+            entry_type=entry["entry_type"],
+            actor=entry.get("actor"),
+            text=entry["text"],
+            text_plain=(
+                entry["text_plain"] if entry.get("text_plain") is not None else strip_ansi(entry["text"])
+            ),
+        )
+        for index, entry in enumerate(entries)
+    ]
+    if objs:
+        SceneEntry.objects.bulk_create(objs, batch_size=500)
+    return objs
+
+
 def strip_ansi(value: str) -> str:
     """Best-effort removal of Evennia ANSI codes for indexing/search."""
 
-    try:
-        from evennia.utils.ansi import strip_ansi as evennia_strip
-
-        return evennia_strip(value)
-    except Exception:  # pragma: no cover
-        return value
+    return _evennia_strip_ansi(value)
 
 
 def _notify_scene_end(scene: SceneLog, room_name: str, auto_closed: bool):
@@ -231,26 +286,29 @@ def _notify_scene_end(scene: SceneLog, room_name: str, auto_closed: bool):
     else:
         message = f"|yScene {scene.pk} at {room_name} has ended.|n"
     
+    # Message online characters through msg() so its hooks run; everyone else
+    # gets a stored copy on their account, written once per account even if
+    # several of its characters took part.
+    offline_accounts = {}
     for participant in participants:
         character = participant.character
         account = participant.account
-        
-        # Try to send to online character first
         if character and hasattr(character, "msg") and hasattr(character, "sessions") and character.sessions.all():
             character.msg(message)
-        # Otherwise store on account for next login
         elif account:
-            notifications = account.attributes.get("_stored_notifications", default=[])
-            notifications.append(message)
-            account.attributes.add("_stored_notifications", notifications)
+            offline_accounts.setdefault(account.id, account)
+
+    for account in offline_accounts.values():
+        notifications = account.attributes.get("_stored_notifications", default=[])
+        account.attributes.add("_stored_notifications", [*notifications, message])
 
 
-def finalize_scene(scene: SceneLog, *, auto_closed: bool = False):
+def finalize_scene(scene: SceneLog, *, auto_closed: bool = False, now: Optional[datetime] = None):
     """Close an active scene, clearing room references and timestamps."""
 
     if scene.status != SceneLog.Status.ACTIVE:
         return
-    now = timezone.now()
+    now = now or timezone.now()
     scene.status = SceneLog.Status.COMPLETED
     scene.auto_closed = auto_closed
     scene.completed_at = now
@@ -261,9 +319,8 @@ def finalize_scene(scene: SceneLog, *, auto_closed: bool = False):
     if scene.room:
         scene.room.attributes.remove("active_scene_id", category="scene")
         # Stop any scene tracker scripts attached to this room
-        for script in scene.room.scripts.all():
-            if script.typeclass_path == SCENE_SCRIPT_TYPECLASS and script.key == str(scene.pk):
-                script.stop()
+        for script in _scene_scripts(scene.room, scene):
+            script.stop()
     SceneParticipant.objects.filter(scene=scene, is_present=True).update(
         is_present=False, last_left_at=now
     )
@@ -303,18 +360,82 @@ def scene_allows_viewer(scene: SceneLog, account) -> bool:
     if SceneParticipant.objects.filter(scene=scene, account=account).exists():
         return True
     if scene.visibility == SceneLog.Visibility.ORGANISATION:
-        organisations = scene.organisations.all()
-        if not organisations:
+        org_ids = set(scene.organisations.values_list("id", flat=True))
+        if not org_ids:
             return False
         from utils.org_utils import get_account_organisations
 
         account_orgs = get_account_organisations(account)
-        org_ids = {org.id for org in organisations}
         if org_ids.intersection(account_orgs):
             return True
     return False
 
 
+def scene_allows_viewer_bulk(scenes: Iterable[SceneLog], account) -> dict[int, bool]:
+    """Answer :func:`scene_allows_viewer` for many scenes at once.
+
+    Participation, scene organisations and the account's organisations are
+    each fetched once, so list pages avoid a round trip per scene.
+
+    Returns:
+        Mapping of scene pk to whether the account may read it.
+    """
+
+    scenes = list(scenes)
+    if not scenes:
+        return {}
+    authenticated = account is not None and getattr(account, "is_authenticated", False)
+    if authenticated and getattr(account, "is_superuser", False):
+        return {scene.pk: True for scene in scenes}
+    if not authenticated:
+        return {scene.pk: scene.visibility == SceneLog.Visibility.EVENT for scene in scenes}
+
+    participating = set(
+        SceneParticipant.objects.filter(scene__in=scenes, account=account).values_list("scene_id", flat=True)
+    )
+    org_scene_ids = [scene.pk for scene in scenes if scene.visibility == SceneLog.Visibility.ORGANISATION]
+    scene_orgs: dict[int, set[int]] = {}
+    account_orgs: set[int] = set()
+    if org_scene_ids:
+        through = SceneLog.organisations.through
+        for scene_id, org_id in through.objects.filter(scenelog_id__in=org_scene_ids).values_list(
+            "scenelog_id", "objectdb_id"
+        ):
+            scene_orgs.setdefault(scene_id, set()).add(org_id)
+        if scene_orgs:
+            from utils.org_utils import get_account_organisations
+
+            account_orgs = get_account_organisations(account)
+
+    allowed = {}
+    for scene in scenes:
+        allowed[scene.pk] = (
+            scene.visibility == SceneLog.Visibility.EVENT
+            or scene.pk in participating
+            or (
+                scene.visibility == SceneLog.Visibility.ORGANISATION
+                and bool(scene_orgs.get(scene.pk, set()) & account_orgs)
+            )
+        )
+    return allowed
+
+
+def _merge_segments(segments, end):
+    """Collapse overlapping participation segments into (start, end) windows.
+
+    Segments must be ordered by ``joined_at``; open segments run until ``end``.
+    """
+
+    merged = []
+    for segment in segments:
+        left = segment.left_at or end
+        if merged and segment.joined_at <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], left))
+        else:
+            merged.append((segment.joined_at, left))
+    return merged
+
+
 def visible_entries_for_account(scene: SceneLog, account):
     """Derive the queryset of entries visible to a particular viewer."""
 
@@ -333,11 +454,11 @@ def visible_entries_for_account(scene: SceneLog, account):
     segments = list(participant.segments.order_by("joined_at"))
     if not segments:
         return scene.entries.none()
-    filters = models.Q()
-    for segment in segments:
-        joined = segment.joined_at
-        left = segment.left_at or scene.completed_at or timezone.now()
-        filters |= models.Q(created_at__gte=joined, created_at__lte=left)
+    end = scene.completed_at or timezone.now()
+    filters = reduce(
+        operator.or_,
+        (models.Q(created_at__range=window) for window in _merge_segments(segments, end)),
+    )
     # Also include entries where the participant is the actor (their own arrivals/departures)
     filters |= models.Q(actor=participant.character)
     return scene.entries.filter(filters).distinct().order_by("sequence") if filters else scene.entries.none()
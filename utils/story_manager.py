@@ -2,10 +2,59 @@
 Manager class for handling story system workflow logic.
 """
 
+from django.db import transaction
+from django.db.models import F, IntegerField, Max, Q
+from django.db.models.functions import Cast, Length, Substr
 from evennia.scripts.models import ScriptDB
 from evennia import create_script
 from datetime import datetime
-from typeclasses.story import StoryElement
+import re
+import time
+from typeclasses.story import StoryElement, StorySystemState
+
+# Matched exactly so lookups can use the index on the typeclass path
+STORY_ELEMENT_TYPECLASS = "typeclasses.story.StoryElement"
+
+# Indexed tags mirroring story attributes that are used in lookups
+STORY_TAG_CATEGORY = "story"
+CURRENT_CHAPTER_TAG = "current_chapter"
+STORY_TYPE_CATEGORY = "story_type"
+STORY_PARENT_CATEGORY = "story_parent"
+PLOT_TITLE_CATEGORY = "plot_title"
+# Tag keys are limited to 255 characters, so longer plot titles are
+# truncated on their title tag
+MAX_TITLE_TAG_LENGTH = 255
+# Bump when _tag_element starts mirroring more attributes (or other derived
+# lookup data changes), so that ensure_story_tags rebuilds it on next start
+STORY_TAGS_VERSION = 3
+
+# Story references: an update number, optionally preceded by a quoted book title
+_STORY_REF_RE = re.compile(r'^\s*(?:"([^"]+)"\s*)?(\d+)\s*$')
+
+# Derived lookups (e.g. the current chapter) are reused for a couple of
+# seconds, which covers the repeated calls made within a single command.
+_MEMO_TTL = 2.0
+_memo = {}
+
+
+def _memoized(name, loader):
+    """Return a short-lived memoized value, computing it with loader on a miss."""
+    now = time.monotonic()
+    entry = _memo.get(name)
+    if entry and entry[0] > now:
+        return entry[1]
+    value = loader()
+    _memo[name] = (now + _MEMO_TTL, value)
+    return value
+
+
+def _fetch_by_key(key):
+    """Fetch a story element by its script key."""
+    return ScriptDB.objects.filter(
+        db_typeclass_path=STORY_ELEMENT_TYPECLASS,
+        db_key=key
+    ).first()
+
 
 class StoryManager:
     """Handles story system workflow logic."""
@@ -24,12 +73,13 @@ class StoryManager:
         Raises:
             ValueError: If title is empty
         """
-        if not title.strip():
+        title = title.strip()
+        if not title:
             raise ValueError("Plot title cannot be empty")
             
         plot_id = cls.get_next_plot_id()
         plot = create_script(
-            "typeclasses.story.StoryElement",
+            STORY_ELEMENT_TYPECLASS,
             key=f"Plot-{plot_id}"
         )
         
@@ -38,11 +88,14 @@ class StoryManager:
             
         plot.db.story_id = plot_id
         plot.db.story_type = "plot"
-        plot.db.title = title.strip()
+        plot.db.title = title
         plot.db.description = description.strip()
         plot.db.is_active = True
+        plot.db.update_ids = set()
         plot.db.timestamp = datetime.now()
+        cls._tag_element(plot)
         
+        _memo.clear()
         return plot
     
     @classmethod
@@ -59,16 +112,16 @@ class StoryManager:
         Raises:
             ValueError: If title is empty
         """
-        if not title.strip():
+        title = title.strip()
+        if not title:
             raise ValueError("Chapter title cannot be empty")
             
         # Get next order number before creating the chapter
-        all_chapters = cls.get_all_chapters()
-        next_order = len(all_chapters) + 1
+        next_order = cls._next_order(cls._tagged("chapter"))
         
         chapter_id = cls.get_next_chapter_id()
         chapter = create_script(
-            "typeclasses.story.StoryElement",
+            STORY_ELEMENT_TYPECLASS,
             key=f"Chapter-{chapter_id}"
         )
         
@@ -77,12 +130,14 @@ class StoryManager:
             
         chapter.db.story_id = chapter_id
         chapter.db.story_type = "chapter"
-        chapter.db.title = title.strip()
+        chapter.db.title = title
         chapter.db.book_title = book_title.strip()
         chapter.db.order = next_order
         chapter.db.is_current = False
         chapter.db.timestamp = datetime.now()
+        cls._tag_element(chapter)
         
+        _memo.clear()
         return chapter
         
     @classmethod
@@ -100,18 +155,19 @@ class StoryManager:
         Raises:
             ValueError: If title or content is empty
         """
-        if not title.strip():
+        title = title.strip()
+        content = content.strip()
+        if not title:
             raise ValueError("Story update title cannot be empty")
-        if not content.strip():
+        if not content:
             raise ValueError("Story update content cannot be empty")
             
         # Get next order number for this chapter before creating the update
-        existing_updates = cls.get_chapter_updates(chapter_id)
-        next_order = len(existing_updates) + 1
+        next_order = cls._next_order(cls._tagged("update", chapter_id))
         
         update_id = cls.get_next_update_id()
         update = create_script(
-            "typeclasses.story.StoryElement",
+            STORY_ELEMENT_TYPECLASS,
             key=f"StoryUpdate-{update_id}"
         )
         
@@ -120,225 +176,362 @@ class StoryManager:
             
         update.db.story_id = update_id
         update.db.story_type = "update"
-        update.db.title = title.strip()
-        update.db.content = content.strip()
+        update.db.title = title
+        update.db.content = content
         update.db.parent_id = chapter_id
         update.db.order = next_order
+        update.db.plot_ids = set()
         update.db.timestamp = datetime.now()
+        cls._tag_element(update)
         
+        _memo.clear()
         return update
         
     @classmethod
     def get_next_plot_id(cls):
-        """Get the next available plot ID."""
-        plots = ScriptDB.objects.filter(
-            db_typeclass_path__contains="story.StoryElement",
-            db_key__startswith="Plot-"
-        )
-        if not plots.exists():
-            return 1
-            
-        max_id = 0
-        for plot in plots:
-            try:
-                if hasattr(plot.db, 'story_id') and plot.db.story_id and plot.db.story_id > max_id:
-                    max_id = plot.db.story_id
-            except AttributeError:
-                continue
-                
-        return max_id + 1
+        """Allocate the next available plot ID."""
+        return cls._allocate_id("next_plot_id", "Plot-")
     
     @classmethod
     def get_next_chapter_id(cls):
-        """Get the next available chapter ID."""
-        chapters = ScriptDB.objects.filter(
-            db_typeclass_path__contains="story.StoryElement",
-            db_key__startswith="Chapter-"
-        )
-        if not chapters.exists():
-            return 1
-            
-        max_id = 0
-        for chapter in chapters:
-            try:
-                if hasattr(chapter.db, 'story_id') and chapter.db.story_id and chapter.db.story_id > max_id:
-                    max_id = chapter.db.story_id
-            except AttributeError:
-                continue
-                
-        return max_id + 1
+        """Allocate the next available chapter ID."""
+        return cls._allocate_id("next_chapter_id", "Chapter-")
         
     @classmethod
     def get_next_update_id(cls):
-        """Get the next available story update ID."""
-        updates = ScriptDB.objects.filter(
-            db_typeclass_path__contains="story.StoryElement",
-            db_key__startswith="StoryUpdate-"
-        )
-        if not updates.exists():
-            return 1
-            
-        max_id = 0
-        for update in updates:
-            try:
-                if hasattr(update.db, 'story_id') and update.db.story_id and update.db.story_id > max_id:
-                    max_id = update.db.story_id
-            except AttributeError:
-                continue
-                
-        return max_id + 1
+        """Allocate the next available story update ID."""
+        return cls._allocate_id("next_update_id", "StoryUpdate-")
+        
+    @classmethod
+    def _allocate_id(cls, counter, prefix):
+        """Hand out the next value of a counter on the story state script.
+        
+        The counter is seeded from the highest existing ID the first time
+        it is used, after which allocation no longer touches other scripts.
+        
+        Args:
+            counter (str): Counter attribute name on the state script
+            prefix (str): Script key prefix used to seed the counter
+            
+        Returns:
+            int: The allocated ID
+        """
+        state = StorySystemState.get_instance()
+        with transaction.atomic():
+            # Lock the state script's row so concurrent allocations queue up,
+            # and read the counter from the database rather than the
+            # attribute cache, which may hold a value another process has
+            # since moved past
+            list(ScriptDB.objects.select_for_update().filter(id=state.id).values_list("id", flat=True))
+            counter_attr = state.db_attributes.filter(db_key=counter, db_category__isnull=True).first()
+            next_id = counter_attr.value if counter_attr else None
+            if not next_id:
+                next_id = cls._max_story_id(prefix) + 1
+            state.attributes.add(counter, next_id + 1)
+        return next_id
+        
+    @classmethod
+    def _max_story_id(cls, prefix):
+        """Get the highest story ID among elements with the given key prefix.
+        
+        Element keys are "<prefix><story id>", so the ID is read from the key
+        in the database instead of loading each element's attributes.
+        """
+        return ScriptDB.objects.filter(
+            db_typeclass_path=STORY_ELEMENT_TYPECLASS,
+            db_key__regex=rf"^{re.escape(prefix)}[0-9]+$",
+        ).annotate(
+            story_number=Cast(Substr("db_key", len(prefix) + 1), IntegerField())
+        ).aggregate(highest=Max("story_number"))["highest"] or 0
         
     @classmethod
     def find_plot(cls, plot_id):
         """Find a plot by its story ID number."""
         try:
             id_num = int(str(plot_id).lstrip('#'))
-            key = f"Plot-{id_num}"
-            results = ScriptDB.objects.filter(
-                db_typeclass_path__contains="story.StoryElement",
-                db_key=key
-            )
-            return results[0] if results else None
-        except (ValueError, IndexError):
+        except ValueError:
             return None
+        return _fetch_by_key(f"Plot-{id_num}")
     
     @classmethod
     def find_plot_by_name(cls, name):
         """Find a plot by its title (case-insensitive partial match)."""
-        plots = cls.get_all_plots()
-        name_lower = name.lower()
+        # Plot titles are mirrored onto lowercased tags, so both passes run in
+        # SQL. Long titles are truncated on their tags, so each candidate is
+        # confirmed against its full title.
+        name_lower = name.strip().lower()
+        tag_key = name_lower[:MAX_TITLE_TAG_LENGTH]
+        plots = cls._tagged("plot").order_by("id")
+        
+        def matching(candidates, matches):
+            return next(
+                (plot for plot in candidates if matches((plot.db.title or "").strip().lower())),
+                None
+            )
         
         # Try exact match first
-        for plot in plots:
-            if plot.db.title.lower() == name_lower:
-                return plot
-        
-        # Try partial match
-        for plot in plots:
-            if name_lower in plot.db.title.lower():
-                return plot
-                
-        return None
+        plot = matching(
+            plots.filter(db_tags__db_key=tag_key, db_tags__db_category=PLOT_TITLE_CATEGORY),
+            lambda title: title == name_lower
+        )
+        if plot:
+            return plot
+        
+        # Try partial match, including the untagged end of truncated titles
+        return matching(
+            plots.filter(
+                db_tags__db_category=PLOT_TITLE_CATEGORY
+            ).annotate(
+                title_tag=F("db_tags__db_key")
+            ).annotate(
+                title_tag_length=Length("title_tag")
+            ).filter(
+                Q(title_tag__contains=tag_key) | Q(title_tag_length__gte=MAX_TITLE_TAG_LENGTH)
+            ),
+            lambda title: name_lower in title
+        )
     
     @classmethod
     def find_chapter(cls, chapter_id):
         """Find a chapter by its story ID number."""
         try:
             id_num = int(str(chapter_id).lstrip('#'))
-            key = f"Chapter-{id_num}"
-            results = ScriptDB.objects.filter(
-                db_typeclass_path__contains="story.StoryElement",
-                db_key=key
-            )
-            return results[0] if results else None
-        except (ValueError, IndexError):
+        except ValueError:
             return None
+        return _fetch_by_key(f"Chapter-{id_num}")
             
     @classmethod
     def find_story_update(cls, update_id):
         """Find a story update by its story ID number."""
         try:
             id_num = int(str(update_id).lstrip('#'))
-            key = f"StoryUpdate-{id_num}"
-            results = ScriptDB.objects.filter(
-                db_typeclass_path__contains="story.StoryElement",
-                db_key=key
-            )
-            return results[0] if results else None
-        except (ValueError, IndexError):
+        except ValueError:
             return None
+        return _fetch_by_key(f"StoryUpdate-{id_num}")
+            
+    @staticmethod
+    def _tagged(story_type, parent_id=None):
+        """Queryset of story elements of a type, optionally under a chapter.
+        
+        Args:
+            story_type (str): "plot", "chapter" or "update"
+            parent_id (int, optional): Chapter ID the updates belong to
+        """
+        scripts = ScriptDB.objects.filter(
+            db_tags__db_key=story_type, db_tags__db_category=STORY_TYPE_CATEGORY
+        )
+        if parent_id is not None:
+            scripts = scripts.filter(
+                db_tags__db_key=str(parent_id), db_tags__db_category=STORY_PARENT_CATEGORY
+            )
+        return scripts
+        
+    @staticmethod
+    def _by_story_ids(prefix, story_ids):
+        """Queryset of the story elements with the given key prefix and IDs.
+        
+        Args:
+            prefix (str): Script key prefix, e.g. "Plot-"
+            story_ids (iterable): Story IDs to fetch
+        """
+        return ScriptDB.objects.filter(
+            db_typeclass_path=STORY_ELEMENT_TYPECLASS,
+            db_key__in=[f"{prefix}{story_id}" for story_id in story_ids],
+        )
+        
+    @staticmethod
+    def _tag_element(script, attrs=None):
+        """Mirror the lookup attributes of a story element onto indexed tags.
+        
+        Args:
+            script (StoryElement): The element to tag
+            attrs (dict, optional): Pre-loaded attribute values; read from
+                the script if not given
+        """
+        if attrs is None:
+            attrs = {
+                key: script.attributes.get(key)
+                for key in ('story_type', 'parent_id', 'is_current', 'title')
+            }
+        story_type = attrs.get('story_type')
+        if story_type:
+            script.tags.add(story_type, category=STORY_TYPE_CATEGORY)
+        if attrs.get('parent_id') is not None:
+            script.tags.add(str(attrs['parent_id']), category=STORY_PARENT_CATEGORY)
+        if story_type == "chapter" and attrs.get('is_current'):
+            script.tags.add(CURRENT_CHAPTER_TAG, category=STORY_TAG_CATEGORY)
+        if story_type == "plot" and attrs.get('title'):
+            script.tags.add(attrs['title'][:MAX_TITLE_TAG_LENGTH], category=PLOT_TITLE_CATEGORY)
+            
+    @classmethod
+    def ensure_story_tags(cls):
+        """Tag story elements and build plot membership sets for old data.
+        
+        Safe to call repeatedly; does nothing once the current tag version
+        has been applied. Called at server start.
+        """
+        state = StorySystemState.get_instance()
+        if state.db.tags_version == STORY_TAGS_VERSION:
+            return
+        scripts = ScriptDB.objects.filter(db_typeclass_path=STORY_ELEMENT_TYPECLASS)
+        elements = cls._with_attributes(scripts)
+        plots_by_update = {}
+        for script, attrs in elements:
+            cls._tag_element(script, attrs)
+            if attrs.get('story_type') == "plot":
+                update_ids = set(attrs.get('update_ids') or ())
+                script.attributes.add('update_ids', update_ids)
+                for update_id in update_ids:
+                    plots_by_update.setdefault(update_id, set()).add(attrs.get('story_id'))
+        
+        # Rebuild the update -> plots reverse map from the plots' update sets
+        for script, attrs in elements:
+            if attrs.get('story_type') == "update":
+                script.attributes.add('plot_ids', plots_by_update.get(attrs.get('story_id'), set()))
+        state.db.tags_version = STORY_TAGS_VERSION
+        _memo.clear()
+        
+    @staticmethod
+    def _attribute_values(queryset, keys):
+        """Read selected attributes for a set of scripts without loading them.
+        
+        Args:
+            queryset (QuerySet): ScriptDB queryset selecting the scripts
+            keys (iterable): Attribute keys to read
+            
+        Returns:
+            dict: script id -> {attribute key: value}
+        """
+        links = ScriptDB.db_attributes.through.objects.filter(
+            scriptdb_id__in=queryset.values("id"),
+            attribute__db_key__in=list(keys),
+            attribute__db_category__isnull=True,
+        ).select_related("attribute")
+        values = {}
+        for link in links:
+            values.setdefault(link.scriptdb_id, {})[link.attribute.db_key] = link.attribute.value
+        return values
+        
+    @classmethod
+    def _next_order(cls, queryset):
+        """Get the order number following the highest one in a set of elements.
+        
+        Only the order attributes are read, so the elements themselves are
+        never loaded or sorted.
+        """
+        orders = cls._attribute_values(queryset, ('order',))
+        return max((attrs.get('order') or 0 for attrs in orders.values()), default=0) + 1
+        
+    @staticmethod
+    def _with_attributes(queryset):
+        """Load scripts together with their story attributes in one query.
+        
+        Args:
+            queryset (QuerySet): ScriptDB queryset to evaluate
+            
+        Returns:
+            list: (script, attrs) pairs where attrs maps attribute key to value
+        """
+        results = []
+        for script in queryset.prefetch_related("db_attributes"):
+            attrs = {
+                attr.db_key: attr.value
+                for attr in script.db_attributes.all()
+                if attr.db_category is None
+            }
+            results.append((script, attrs))
+        return results
             
     @classmethod
     def get_current_chapter(cls):
         """Get the currently active chapter."""
-        scripts = ScriptDB.objects.filter(
-            db_typeclass_path__contains="story.StoryElement",
-            db_key__startswith="Chapter-"
-        )
-        for script in scripts:
-            if hasattr(script.db, 'is_current') and script.db.is_current:
-                return script
-        return None
+        return _memoized("current_chapter", cls._load_current_chapter)
+        
+    @classmethod
+    def _load_current_chapter(cls):
+        """Look up the currently active chapter via its indexed tag."""
+        return ScriptDB.objects.get_by_tag(
+            key=CURRENT_CHAPTER_TAG, category=STORY_TAG_CATEGORY
+        ).first()
         
     @classmethod
     def get_all_chapters(cls):
         """Get all chapters, ordered by sequence."""
-        scripts = ScriptDB.objects.filter(
-            db_typeclass_path__contains="story.StoryElement",
-            db_key__startswith="Chapter-"
-        )
-        chapters = [s for s in scripts if hasattr(s.db, 'story_type') and s.db.story_type == "chapter"]
-        return sorted(chapters, key=lambda x: getattr(x.db, 'order', 0))
+        return list(_memoized("all_chapters", cls._load_all_chapters))
+        
+    @classmethod
+    def _load_all_chapters(cls):
+        """Load all chapters, sorted by their order attribute."""
+        chapters = cls._with_attributes(cls._tagged("chapter"))
+        chapters.sort(key=lambda pair: pair[1].get('order', 0))
+        return [script for script, attrs in chapters]
         
     @classmethod
     def get_chapter_updates(cls, chapter_id):
         """Get all story updates for a specific chapter."""
-        scripts = ScriptDB.objects.filter(
-            db_typeclass_path__contains="story.StoryElement",
-            db_key__startswith="StoryUpdate-"
-        )
-        updates = []
-        for script in scripts:
-            if (hasattr(script.db, 'story_type') and script.db.story_type == "update" and
-                hasattr(script.db, 'parent_id') and script.db.parent_id == chapter_id):
-                updates.append(script)
-        return sorted(updates, key=lambda x: getattr(x.db, 'order', 0))
+        updates = cls._with_attributes(cls._tagged("update", parent_id=chapter_id))
+        updates.sort(key=lambda pair: pair[1].get('order', 0))
+        return [script for script, attrs in updates]
         
     @classmethod
     def get_all_plots(cls):
         """Get all plots, ordered by creation."""
-        scripts = ScriptDB.objects.filter(
-            db_typeclass_path__contains="story.StoryElement",
-            db_key__startswith="Plot-"
-        )
-        plots = [s for s in scripts if hasattr(s.db, 'story_type') and s.db.story_type == "plot"]
-        return sorted(plots, key=lambda x: getattr(x.db, 'story_id', 0))
+        plots = cls._with_attributes(cls._tagged("plot"))
+        plots.sort(key=lambda pair: pair[1].get('story_id') or 0)
+        return [script for script, attrs in plots]
     
     @classmethod
     def get_plot_updates(cls, plot_id):
         """Get all story updates for a specific plot, ordered by timestamp."""
         # Find the plot
         plot = cls.find_plot(plot_id)
-        if not plot or not hasattr(plot.db, 'update_ids'):
+        if not plot:
+            return []
+        update_ids = cls._id_set(plot, 'update_ids')
+        if not update_ids:
             return []
         
-        # Get the updates from the plot's list
-        updates = []
-        for update_id in plot.db.update_ids:
-            update = cls.find_story_update(update_id)
-            if update:
-                updates.append(update)
-        
-        return sorted(updates, key=lambda x: getattr(x.db, 'timestamp', datetime.min))
+        # Fetch all of the plot's updates in one query, oldest first
+        return list(cls._by_story_ids("StoryUpdate-", update_ids).order_by('db_date_created', 'id'))
     
     @classmethod
     def get_recent_updates(cls, limit=5):
         """Get the most recent story updates across all chapters."""
-        scripts = ScriptDB.objects.filter(
-            db_typeclass_path__contains="story.StoryElement",
-            db_key__startswith="StoryUpdate-"
-        )
-        updates = [s for s in scripts if hasattr(s.db, 'story_type') and s.db.story_type == "update"]
-        return sorted(updates, key=lambda x: getattr(x.db, 'timestamp', datetime.min), reverse=True)[:limit]
+        # Update timestamps are only set at creation, so the script's
+        # creation date gives the same order without reading attributes
+        return list(cls._tagged("update").order_by('-db_date_created', '-id')[:limit])
+        
+    @classmethod
+    def get_update_count(cls):
+        """Get the total number of story updates."""
+        return cls._tagged("update").count()
         
     @classmethod
     def set_current_chapter(cls, chapter_id):
         """Set the current chapter by clearing all current flags and setting one."""
-        # Clear all current flags
-        all_chapters = cls.get_all_chapters()
-        for chapter in all_chapters:
-            chapter.db.is_current = False
-            
-        # Set the target chapter as current
-        target_chapter = cls.find_chapter(chapter_id)
-        if target_chapter:
-            target_chapter.db.is_current = True
-            return target_chapter
-        return None 
+        with transaction.atomic():
+            # Clear the current flag; only chapters carrying the current tag
+            # (normally just one) need writing, not every chapter
+            for chapter in ScriptDB.objects.get_by_tag(key=CURRENT_CHAPTER_TAG, category=STORY_TAG_CATEGORY):
+                chapter.db.is_current = False
+                chapter.tags.remove(CURRENT_CHAPTER_TAG, category=STORY_TAG_CATEGORY)
+                
+            # Set the target chapter as current
+            target_chapter = cls.find_chapter(chapter_id)
+            if target_chapter:
+                target_chapter.db.is_current = True
+                target_chapter.tags.add(CURRENT_CHAPTER_TAG, category=STORY_TAG_CATEGORY)
+        _memo.clear()
+        return target_chapter
         
     @classmethod
     def get_current_book_title(cls):
         """Get the book title of the current chapter."""
+        return _memoized("current_book_title", cls._load_current_book_title)
+        
+    @classmethod
+    def _load_current_book_title(cls):
+        """Look up the book title of the current chapter."""
         current_chapter = cls.get_current_chapter()
         if current_chapter:
             return current_chapter.db.book_title or "Untitled Book"
@@ -348,6 +541,11 @@ class StoryManager:
     def get_book_scoped_number(cls, global_update_id, book_title=None):
         """Get the book-scoped number for a global update ID.
         
+        Book numbers are positions in the book's chronological update list,
+        so they are derived from the memoized book index rather than stored
+        on each update; deleting an update or moving a chapter between books
+        renumbers the rest without any writes.
+        
         Args:
             global_update_id (int): Global story update ID
             book_title (str, optional): Book to check in. If None, uses current book.
@@ -358,15 +556,8 @@ class StoryManager:
         if book_title is None:
             book_title = cls.get_current_book_title()
             
-        # Get all updates in this book, ordered by timestamp
-        updates_in_book = cls.get_updates_in_book(book_title)
-        
-        # Find the position of our update
-        for i, update in enumerate(updates_in_book):
-            if update.db.story_id == global_update_id:
-                return i + 1  # Convert to 1-based numbering
-        
-        return None
+        updates_in_book, positions = cls._book_index(book_title)
+        return positions.get(global_update_id)
         
     @classmethod
     def find_update_by_book_scoped_number(cls, book_scoped_id, book_title=None):
@@ -382,8 +573,7 @@ class StoryManager:
         if book_title is None:
             book_title = cls.get_current_book_title()
             
-        # Get all updates in this book, ordered by timestamp
-        updates_in_book = cls.get_updates_in_book(book_title)
+        updates_in_book, positions = cls._book_index(book_title)
         
         # Check if the requested number is valid
         if book_scoped_id < 1 or book_scoped_id > len(updates_in_book):
@@ -402,18 +592,109 @@ class StoryManager:
         Returns:
             list: List of StoryElement updates in chronological order
         """
-        # Get all chapters with this book title
-        all_chapters = cls.get_all_chapters()
-        book_chapters = [ch for ch in all_chapters if (ch.db.book_title or "Untitled Book") == book_title]
+        updates_in_book, positions = cls._book_index(book_title)
+        return list(updates_in_book)
+        
+    @classmethod
+    def _book_index(cls, book_title):
+        """Get a book's ordered updates and a {story_id: book number} map.
+        
+        Memoized per book, so the lookups made while handling one command
+        share a single scan. Cleared along with the other memoized values.
+        """
+        return _memoized(("book_index", book_title), lambda: cls._load_book_index(book_title))
         
-        # Get all updates from these chapters
-        all_updates = []
-        for chapter in book_chapters:
-            chapter_updates = cls.get_chapter_updates(chapter.db.story_id)
-            all_updates.extend(chapter_updates)
+    @classmethod
+    def _load_book_index(cls, book_title):
+        """Build the uncached index returned by _book_index."""
+        chapter_ids = cls._book_chapter_ids(book_title)
+        all_updates = [
+            pair
+            for updates in cls._updates_by_chapter(chapter_ids.values()).values()
+            for pair in updates
+        ]
+            
+        # Sort by creation time, which is when the timestamp was set
+        all_updates.sort(key=lambda pair: (pair[0].db_date_created, pair[0].id))
+        updates = [script for script, attrs in all_updates]
+        positions = {
+            attrs.get('story_id'): position
+            for position, (script, attrs) in enumerate(all_updates, 1)
+        }
+        return updates, positions
+        
+    @classmethod
+    def get_updates_by_chapter(cls, chapter_ids):
+        """Get the updates of several chapters with a single query.
+        
+        Args:
+            chapter_ids (iterable): Chapter story IDs
+            
+        Returns:
+            dict: chapter story id -> list of updates in update order
+        """
+        return {
+            chapter_id: [update for update, _ in updates]
+            for chapter_id, updates in cls._updates_by_chapter(chapter_ids).items()
+        }
+        
+    @classmethod
+    def _book_chapter_ids(cls, book_title):
+        """Get {script id: story id} for the chapters in a book."""
+        return {
+            script_id: chapter_id
+            for chapter_id, (script_id, chapter_book) in cls._chapter_books().items()
+            if chapter_book == book_title
+        }
+        
+    @classmethod
+    def _chapter_books(cls):
+        """Get {chapter story id: (script id, book title)} for every chapter.
+        
+        Only the story_id and book_title attributes are read, so no chapter
+        is loaded. Memoized alongside the other derived lookups.
+        """
+        def load():
+            chapter_attrs = cls._attribute_values(cls._tagged("chapter"), ('story_id', 'book_title'))
+            return {
+                attrs.get('story_id'): (script_id, attrs.get('book_title') or "Untitled Book")
+                for script_id, attrs in chapter_attrs.items()
+            }
+        return _memoized("chapter_books", load)
+        
+    @classmethod
+    def _updates_by_chapter(cls, chapter_ids):
+        """Fetch the updates of several chapters in one query.
+        
+        Args:
+            chapter_ids (iterable): Chapter story IDs
             
-        # Sort by timestamp
-        return sorted(all_updates, key=lambda x: getattr(x.db, 'timestamp', datetime.min))
+        Returns:
+            dict: chapter story id -> list of (update, attrs) pairs in update order
+        """
+        chapter_ids = [str(chapter_id) for chapter_id in chapter_ids]
+        if not chapter_ids:
+            return {}
+        scripts = cls._tagged("update").filter(
+            db_tags__db_key__in=chapter_ids, db_tags__db_category=STORY_PARENT_CATEGORY
+        )
+        grouped = {}
+        for update, attrs in cls._with_attributes(scripts):
+            grouped.setdefault(attrs.get('parent_id'), []).append((update, attrs))
+        for updates in grouped.values():
+            updates.sort(key=lambda pair: pair[1].get('order', 0))
+        return grouped
+        
+    @classmethod
+    def set_chapter_book(cls, chapter, book_title):
+        """Move a chapter to another book.
+        
+        Args:
+            chapter (StoryElement): The chapter to move
+            book_title (str): The new book title
+        """
+        chapter.db.book_title = book_title
+        _memo.clear()
         
     @classmethod
     def parse_story_reference(cls, args_str):
@@ -429,48 +710,31 @@ class StoryManager:
         Returns:
             tuple: (update, book_title_used) or (None, None) if not found
         """
-        if not args_str:
+        match = _STORY_REF_RE.match(args_str or "")
+        if not match:
             return None, None
-            
-        args_str = args_str.strip()
+        book_title, number = match.group(1), int(match.group(2))
         
-        # Check if it starts with a quote (book title specified)
-        if args_str.startswith('"'):
-            # Find the closing quote
-            quote_end = args_str.find('"', 1)
-            if quote_end == -1:
-                return None, None
-                
-            book_title = args_str[1:quote_end]
-            remaining = args_str[quote_end + 1:].strip()
-            
-            # Parse the number
-            try:
-                book_scoped_id = int(remaining)
-                update = cls.find_update_by_book_scoped_number(book_scoped_id, book_title)
-                return update, book_title
-            except ValueError:
-                return None, None
-        else:
-            # No quotes - try book-scoped number in current book first
-            try:
-                book_scoped_id = int(args_str)
-                current_book = cls.get_current_book_title()
-                update = cls.find_update_by_book_scoped_number(book_scoped_id, current_book)
-                if update:
-                    return update, current_book
-                else:
-                    # Fallback: try as global ID
-                    update = cls.find_story_update(book_scoped_id)
-                    if update:
-                        # Find which book this belongs to
-                        chapter = cls.find_chapter(update.db.parent_id) if update.db.parent_id else None
-                        if chapter:
-                            fallback_book = chapter.db.book_title or "Untitled Book"
-                            return update, fallback_book
-                    return None, None
-            except ValueError:
-                return None, None
+        if book_title is not None:
+            # Book title specified
+            update = cls.find_update_by_book_scoped_number(number, book_title)
+            return update, book_title
+            
+        # No quotes - try book-scoped number in current book first. Numbers
+        # past the end of the book can only be global IDs.
+        current_book = cls.get_current_book_title()
+        updates_in_book, positions = cls._book_index(current_book)
+        if 1 <= number <= len(updates_in_book):
+            return updates_in_book[number - 1], current_book
+            
+        # Fallback: try as global ID
+        update = cls.find_story_update(number)
+        if update:
+            # Find which book this belongs to from the memoized chapter map
+            chapter = cls._chapter_books().get(update.attributes.get('parent_id'))
+            if chapter:
+                return update, chapter[1]
+        return None, None
     
     @classmethod
     def delete_plot(cls, plot_id):
@@ -493,15 +757,40 @@ class StoryManager:
         if not plot:
             return False, f"Plot #{plot_id} not found", 0
         
-        # Count how many updates were in this plot
-        update_count = len(plot.db.update_ids) if hasattr(plot.db, 'update_ids') else 0
-        
-        # Delete the plot itself (updates remain untouched)
+        # Count how many updates were in this plot and unlink them
+        update_ids = cls._id_set(plot, 'update_ids')
+        update_count = len(update_ids)
         plot_title = plot.db.title
-        plot.delete()
+        with transaction.atomic():
+            for update_id in update_ids:
+                update = cls.find_story_update(update_id)
+                if update:
+                    cls._id_set(update, 'plot_ids').discard(plot.db.story_id)
+            
+            # Delete the plot itself (updates remain untouched)
+            plot.delete()
+        _memo.clear()
         
         return True, f"Deleted plot #{plot_id}: {plot_title}", update_count
     
+    @staticmethod
+    def _id_set(script, key):
+        """Get a stored set of story IDs, converting a legacy list in place.
+        
+        Args:
+            script (StoryElement): Element holding the IDs
+            key (str): Attribute name, "update_ids" on plots or "plot_ids"
+                on updates
+            
+        Returns:
+            set: The stored set; changes to it are saved automatically
+        """
+        ids = script.attributes.get(key)
+        if not hasattr(ids, 'add'):
+            script.attributes.add(key, set(ids or ()))
+            ids = script.attributes.get(key)
+        return ids
+    
     @classmethod
     def add_update_to_plots(cls, update_id, plot_ids):
         """Add an update to one or more plots.
@@ -513,15 +802,16 @@ class StoryManager:
         Returns:
             list: Successfully added plot names
         """
+        update = cls.find_story_update(update_id)
         added_plots = []
-        for plot_id in plot_ids:
-            plot = cls.find_plot(plot_id)
-            if plot:
-                if not hasattr(plot.db, 'update_ids'):
-                    plot.db.update_ids = []
-                if update_id not in plot.db.update_ids:
-                    plot.db.update_ids.append(update_id)
-                added_plots.append(plot.db.title)
+        with transaction.atomic():
+            for plot_id in plot_ids:
+                plot = cls.find_plot(plot_id)
+                if plot:
+                    cls._id_set(plot, 'update_ids').add(update_id)
+                    if update:
+                        cls._id_set(update, 'plot_ids').add(plot.db.story_id)
+                    added_plots.append(plot.db.title)
         return added_plots
     
     @classmethod
@@ -535,17 +825,22 @@ class StoryManager:
         Returns:
             int: Number of plots the update was removed from
         """
+        update = cls.find_story_update(update_id)
         if plot_ids is None:
-            # Remove from all plots
-            all_plots = cls.get_all_plots()
-            plot_ids = [p.db.story_id for p in all_plots]
+            # Remove from every plot the update is in
+            plot_ids = list(cls._id_set(update, 'plot_ids')) if update else []
         
         removed_count = 0
-        for plot_id in plot_ids:
-            plot = cls.find_plot(plot_id)
-            if plot and hasattr(plot.db, 'update_ids') and update_id in plot.db.update_ids:
-                plot.db.update_ids.remove(update_id)
-                removed_count += 1
+        with transaction.atomic():
+            for plot in cls._by_story_ids("Plot-", plot_ids):
+                update_ids = cls._id_set(plot, 'update_ids')
+                if update_id in update_ids:
+                    update_ids.discard(update_id)
+                    removed_count += 1
+            if update:
+                update_plot_ids = cls._id_set(update, 'plot_ids')
+                for plot_id in plot_ids:
+                    update_plot_ids.discard(plot_id)
         
         return removed_count
     
@@ -559,12 +854,41 @@ class StoryManager:
         Returns:
             list: List of plot objects containing this update
         """
-        all_plots = cls.get_all_plots()
-        containing_plots = []
-        for plot in all_plots:
-            if hasattr(plot.db, 'update_ids') and update_id in plot.db.update_ids:
-                containing_plots.append(plot)
-        return containing_plots
+        update = cls.find_story_update(update_id)
+        if not update:
+            return []
+        plots = cls._with_attributes(cls._by_story_ids("Plot-", cls._id_set(update, 'plot_ids')))
+        plots.sort(key=lambda pair: pair[1].get('story_id') or 0)
+        return [script for script, attrs in plots]
+    
+    @classmethod
+    def delete_story_update(cls, update):
+        """Delete a story update.
+        
+        Args:
+            update (StoryElement): The story update to delete
+        """
+        with transaction.atomic():
+            cls.remove_update_from_plots(update.db.story_id)
+            update.delete()
+        _memo.clear()
+    
+    @classmethod
+    def _unlink_updates_from_plots(cls, updates):
+        """Drop a batch of updates from the plots that list them.
+        
+        Args:
+            updates (QuerySet): ScriptDB queryset of the updates
+        """
+        update_attrs = cls._attribute_values(updates, ('story_id', 'plot_ids')).values()
+        plot_ids = {plot_id for attrs in update_attrs for plot_id in attrs.get('plot_ids') or ()}
+        if not plot_ids:
+            return
+        story_ids = [attrs.get('story_id') for attrs in update_attrs]
+        for plot in cls._by_story_ids("Plot-", plot_ids):
+            plot_update_ids = cls._id_set(plot, 'update_ids')
+            for story_id in story_ids:
+                plot_update_ids.discard(story_id)
     
     @classmethod
     def delete_chapter(cls, chapter_id):
@@ -588,14 +912,18 @@ class StoryManager:
         if chapter.db.is_current:
             return False, "Cannot delete the current chapter. Set a different chapter as current first.", 0
         
-        # Get and delete all story updates in this chapter
-        updates = cls.get_chapter_updates(chapter_id)
-        deleted_count = len(updates)
-        for update in updates:
-            update.delete()
-        
-        # Delete the chapter itself
+        # Delete all story updates in this chapter
+        updates = cls._tagged("update", parent_id=chapter_id)
         chapter_title = chapter.db.title
-        chapter.delete()
+        with transaction.atomic():
+            cls._unlink_updates_from_plots(updates)
+            deleted_count = 0
+            for update in updates:
+                update.delete()
+                deleted_count += 1
+            
+            # Delete the chapter itself
+            chapter.delete()
+        _memo.clear()
         
         return True, f"Deleted chapter #{chapter_id}: {chapter_title}", deleted_count 
\ No newline at end of file
@@ -2,9 +2,20 @@
 Definitions for character traits, including attributes, skills, and distinctions.
 """
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, Tuple
 
-@dataclass
+__all__ = [
+    "TraitDefinition",
+    "ATTRIBUTES",
+    "SKILLS",
+    "DISTINCTIONS",
+    "ATTRIBUTES_BY_KEY",
+    "SKILLS_BY_KEY",
+    "DISTINCTIONS_BY_KEY",
+    "ALL_TRAITS_BY_KEY",
+]
+
+@dataclass(frozen=True, slots=True)
 class TraitDefinition:
     """Represents a trait definition with its key, name, and description."""
     key: str
@@ -13,17 +24,17 @@ class TraitDefinition:
     default_value: int
 
 # Attribute definitions (all start at d6 - "typical person")
-ATTRIBUTES: List[TraitDefinition] = [
+ATTRIBUTES: Tuple[TraitDefinition, ...] = (
     TraitDefinition("mind", "Mind", "", 6),
     TraitDefinition("spirit", "Spirit", "", 6),
     TraitDefinition("social", "Social", "", 6),
     TraitDefinition("leadership", "Leadership", "", 6),
     TraitDefinition("prowess", "Prowess", "", 6),
     TraitDefinition("finesse", "Finesse", "", 6)
-]
+)
 
 # Skill definitions (all start at d4 - "untrained")
-SKILLS: List[TraitDefinition] = [
+SKILLS: Tuple[TraitDefinition, ...] = (
     TraitDefinition("administration", "Administration", "", 4),
     TraitDefinition("arcana", "Arcana", "", 4),
     TraitDefinition("athletics", "Athletics", "", 4),
@@ -43,11 +54,21 @@ SKILLS: List[TraitDefinition] = [
     TraitDefinition("seafaring", "Seafaring", "", 4),
     TraitDefinition("survival", "Survival", "", 4),
     TraitDefinition("warfare", "Warfare", "", 4)
-]
+)
 
 # Distinction definitions (all start at d8)
-DISTINCTIONS: List[TraitDefinition] = [
+DISTINCTIONS: Tuple[TraitDefinition, ...] = (
     TraitDefinition("concept", "Character Concept", "Core character concept (e.g. Bold Adventurer)", 8),
     TraitDefinition("culture", "Culture", "Character's cultural origin", 8),
     TraitDefinition("vocation", "Vocation", "Character's profession or calling", 8)
-] 
\ No newline at end of file
+)
+
+# Lookup tables by trait key
+ATTRIBUTES_BY_KEY: Dict[str, TraitDefinition] = {trait.key: trait for trait in ATTRIBUTES}
+SKILLS_BY_KEY: Dict[str, TraitDefinition] = {trait.key: trait for trait in SKILLS}
+DISTINCTIONS_BY_KEY: Dict[str, TraitDefinition] = {trait.key: trait for trait in DISTINCTIONS}
+ALL_TRAITS_BY_KEY: Dict[str, TraitDefinition] = {
+    **ATTRIBUTES_BY_KEY,
+    **SKILLS_BY_KEY,
+    **DISTINCTIONS_BY_KEY,
+}
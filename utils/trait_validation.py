@@ -1,14 +1,18 @@
 """
 Centralized trait validation and manipulation utilities.
 """
+import re
 from typing import Optional, Tuple, Dict, Any, Union
 from .trait_definitions import TraitDefinition
 from .cortex import DIE_SIZES
 
+# Die size as typed in commands, e.g. "d8"
+_DIE_RE = re.compile(rf"^d({'|'.join(DIE_SIZES)})$")
+
 class TraitValidator:
     """Centralized trait validation and helper methods."""
     
-    VALID_DIE_SIZES = set(DIE_SIZES)
+    VALID_DIE_SIZES = frozenset(DIE_SIZES)
     
     TRAIT_CATEGORIES = {
         'attributes': 'character_attributes',
@@ -32,11 +36,9 @@ class TraitValidator:
     @classmethod
     def get_trait_handler(cls, character: Any, category: str) -> Optional[Any]:
         """Get the appropriate trait handler for a category."""
-        category = category.lower()
-        if category not in cls.TRAIT_CATEGORIES:
+        handler_name = cls.TRAIT_CATEGORIES.get(category.lower())
+        if not handler_name:
             return None
-        
-        handler_name = cls.TRAIT_CATEGORIES[category]
         return getattr(character, handler_name, None)
     
     @classmethod
@@ -50,8 +52,10 @@ class TraitValidator:
         if not args or "=" not in args:
             return None
             
-        char_name, rest = [part.strip() for part in args.split("=", 1)]
-        parts = rest.strip().split()
+        char_name, _, rest = args.partition("=")
+        char_name = char_name.strip()
+        # Stop after the third token; the remainder is the description
+        parts = rest.split(maxsplit=3)
         
         if len(parts) < 3:
             return None
@@ -59,17 +63,16 @@ class TraitValidator:
         category = parts[0].lower()
         trait_name = parts[1].lower()
         die_size = parts[2]
-        description = " ".join(parts[3:]) if len(parts) > 3 else ""
+        description = parts[3].strip() if len(parts) > 3 else ""
         
-        # Validate die size format
-        if not die_size.startswith('d') or not die_size[1:].isdigit():
+        # Validate die size format and value in one match
+        match = _DIE_RE.match(die_size)
+        if not match:
             return None
+        die_value = match.group(1)
             
-        die_value = die_size[1:]
-        if not cls.validate_die_size(die_value):
-            return None
-            
-        if not cls.validate_trait_category(category):
+        # category is already lowercased
+        if category not in cls.TRAIT_CATEGORIES:
             return None
             
         return char_name, category, trait_name, die_value, description
@@ -1,8 +1,13 @@
 """
 Utility helpers for managing worn items on characters.
+
+Worn items are stored as an ordered list of object ids in the character's
+``worn_items`` attribute. Evennia caches attributes per object, so reads
+come from memory and only changes cost a database write; the list order
+is the order items are shown in descriptions.
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from evennia.objects.models import ObjectDB
 
@@ -22,44 +27,35 @@ def _normalize_entry(entry) -> Optional[int]:
 
 def _get_worn_ids(character) -> List[int]:
     """Fetch and normalise the stored worn item ids for a character."""
-    stored = character.db.worn_items or []
-    ids: List[int] = []
-    changed = False
-    for entry in stored:
-        obj_id = _normalize_entry(entry)
-        if obj_id is None:
-            changed = True
-            continue
-        ids.append(obj_id)
-        if not isinstance(entry, int):
-            changed = True
-    if changed:
+    stored = list(character.db.worn_items or [])
+    # Fast path: already normalised, so there is nothing to convert or save
+    if all(type(entry) is int for entry in stored):
+        return stored
+    ids: List[int] = [
+        obj_id for obj_id in (_normalize_entry(entry) for entry in stored) if obj_id is not None
+    ]
+    if ids != stored:
         character.db.worn_items = ids
     return ids
 
 
 def get_worn_items(character) -> List[object]:
-    """Return worn items as live objects, cleaning stale references."""
+    """Return worn items as live objects, cleaning stale references.
+
+    Items are resolved by id alone, so the character's inventory is never
+    loaded; the cost scales with the number of worn items.
+    """
     ids = _get_worn_ids(character)
     if not ids:
         return []
 
-    contents_map = {obj.id: obj for obj in character.contents}
-    missing = [obj_id for obj_id in ids if obj_id not in contents_map]
-    db_map = {}
-    if missing:
-        db_objects = ObjectDB.objects.filter(id__in=set(missing))
-        db_map = {obj.id: obj for obj in db_objects}
+    # One indexed primary-key lookup, whatever the size of the inventory
+    objects_by_id = ObjectDB.objects.in_bulk(ids)
+    resolved = [objects_by_id[obj_id] for obj_id in ids if obj_id in objects_by_id]
 
-    resolved = []
-    for obj_id in ids:
-        obj = contents_map.get(obj_id) or db_map.get(obj_id)
-        if obj:
-            resolved.append(obj)
-
-    cleaned_ids = [obj.id for obj in resolved]
-    if cleaned_ids != ids:
-        character.db.worn_items = cleaned_ids
+    # Stored ids are unique, so a shorter result means some were stale
+    if len(resolved) != len(ids):
+        character.db.worn_items = [obj.id for obj in resolved]
 
     return resolved
 
@@ -89,3 +85,35 @@ def remove_worn_item(character, item) -> bool:
     character.db.worn_items = updated
     return True
 
+
+def bulk_add_worn_items(character, items: Iterable) -> int:
+    """Track several items as worn with a single write.
+
+    Returns:
+        int: Number of items newly marked as worn
+    """
+    ids = _get_worn_ids(character)
+    merged = list(dict.fromkeys(
+        ids + [obj_id for obj_id in (_normalize_entry(item) for item in items) if obj_id is not None]
+    ))
+    added = len(merged) - len(ids)
+    if added:
+        character.db.worn_items = merged
+    return added
+
+
+def bulk_remove_worn_items(character, items: Iterable) -> int:
+    """Stop tracking several items as worn with a single write.
+
+    Returns:
+        int: Number of items that were removed
+    """
+    to_remove = {obj_id for obj_id in (_normalize_entry(item) for item in items) if obj_id is not None}
+    if not to_remove:
+        return 0
+    ids = _get_worn_ids(character)
+    updated = [existing for existing in ids if existing not in to_remove]
+    removed = len(ids) - len(updated)
+    if removed:
+        character.db.worn_items = updated
+    return removed
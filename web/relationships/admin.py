@@ -9,15 +9,16 @@ class FamilyRelationshipAdmin(admin.ModelAdmin):
     search_fields = ['character_id', 'related_character_name']
     ordering = ['character_id', 'relationship_type']
     
+    def get_changelist_instance(self, request):
+        # Resolve every name on the current page up front instead of per row
+        changelist = super().get_changelist_instance(request)
+        FamilyRelationship.prime_name_cache(changelist.result_list)
+        return changelist
+    
     def get_character_name(self, obj):
-        try:
-            from evennia.objects.models import ObjectDB
-            char = ObjectDB.objects.get(id=obj.character_id)
-            return char.db.full_name or char.name
-        except ObjectDB.DoesNotExist:
-            return f"Unknown (ID: {obj.character_id})"
+        return obj.get_character_display_name()
     get_character_name.short_description = 'Character'
     
     def get_related_character_display_name(self, obj):
         return obj.get_related_character_display_name()
-    get_related_character_display_name.short_description = 'Related To' 
\ No newline at end of file
+    get_related_character_display_name.short_description = 'Related To'
@@ -1,3 +1,5 @@
+from types import MappingProxyType
+
 from django.db import models
 from evennia.objects.models import ObjectDB
 
@@ -22,8 +24,11 @@ FAMILY_RELATIONSHIP_CHOICES = [
     ('sibling_in_law', 'Sibling-in-Law'),
 ]
 
+# Relationship type -> display label, for rendering without walking the choices
+RELATIONSHIP_DISPLAY = MappingProxyType(dict(FAMILY_RELATIONSHIP_CHOICES))
+
 # Reciprocal relationship mapping
-RECIPROCAL_RELATIONSHIPS = {
+RECIPROCAL_RELATIONSHIPS = MappingProxyType({
     'parent': 'child',
     'child': 'parent',
     'grandparent': 'grandchild',
@@ -41,7 +46,38 @@ RECIPROCAL_RELATIONSHIPS = {
     'parent_in_law': 'child_in_law',
     'child_in_law': 'parent_in_law',
     'sibling_in_law': 'sibling_in_law',
-}
+})
+
+
+def get_display_names(character_ids):
+    """
+    Resolve display names (full name, falling back to key) for many
+    characters with two queries.
+    
+    Returns a dict of character id -> display name; ids with no matching
+    object are left out.
+    """
+    ids = {character_id for character_id in character_ids if character_id}
+    if not ids:
+        return {}
+    names = dict(ObjectDB.objects.filter(id__in=ids).values_list('id', 'db_key'))
+    names.update(get_full_names(names))
+    return names
+
+
+def get_full_names(character_ids):
+    """
+    Load the full_name attribute for many characters in one query.
+    
+    Returns a dict of character id -> full name; characters without a
+    full name are left out.
+    """
+    links = ObjectDB.db_attributes.through.objects.filter(
+        objectdb_id__in=list(character_ids),
+        attribute__db_key='full_name',
+        attribute__db_category__isnull=True,
+    ).select_related('attribute')
+    return {link.objectdb_id: link.attribute.value for link in links if link.attribute.value}
 
 
 class FamilyRelationship(models.Model):
@@ -80,30 +116,47 @@ class FamilyRelationship(models.Model):
     
     def __str__(self):
         if self.related_character_id:
-            try:
-                related_char = ObjectDB.objects.get(id=self.related_character_id)
-                related_name = related_char.db.full_name or related_char.name
-            except ObjectDB.DoesNotExist:
-                related_name = f"Unknown PC (ID: {self.related_character_id})"
+            related_name = self.get_related_character_display_name()
         else:
             related_name = f"{self.related_character_name} (NPC)"
+        return f"{self.get_character_display_name()}'s {self.get_relationship_type_display()}: {related_name}"
+    
+    @classmethod
+    def prime_name_cache(cls, relationships):
+        """
+        Resolve the character names for many relationships at once, so
+        displaying them doesn't query per relationship.
         
-        try:
-            char = ObjectDB.objects.get(id=self.character_id)
-            char_name = char.db.full_name or char.name
-        except ObjectDB.DoesNotExist:
-            char_name = f"Unknown (ID: {self.character_id})"
-            
-        return f"{char_name}'s {self.get_relationship_type_display()}: {related_name}"
+        Returns the relationships as a list.
+        """
+        relationships = list(relationships)
+        character_ids = set()
+        for relationship in relationships:
+            character_ids.add(relationship.character_id)
+            character_ids.add(relationship.related_character_id)
+        names = get_display_names(character_ids)
+        for relationship in relationships:
+            relationship._display_names = names
+        return relationships
+    
+    def _lookup_display_name(self, character_id):
+        """Get a character's display name, from the primed names if present."""
+        names = getattr(self, '_display_names', None)
+        if names is None:
+            names = get_display_names([character_id])
+        return names.get(character_id)
+    
+    def get_character_display_name(self):
+        """Get the display name for the character who has this relationship."""
+        return self._lookup_display_name(self.character_id) or f"Unknown (ID: {self.character_id})"
     
     def get_related_character_display_name(self):
         """Get the display name for the related character."""
         if self.related_character_id:
-            try:
-                related_char = ObjectDB.objects.get(id=self.related_character_id)
-                return related_char.db.full_name or related_char.name
-            except ObjectDB.DoesNotExist:
-                return f"Unknown PC (ID: {self.related_character_id})"
+            return (
+                self._lookup_display_name(self.related_character_id)
+                or f"Unknown PC (ID: {self.related_character_id})"
+            )
         else:
             return self.related_character_name
     
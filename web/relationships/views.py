@@ -1,21 +1,40 @@
 from django.db import transaction
+from django.db.models import Prefetch
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
+from django.core.paginator import Paginator
 from django.http import JsonResponse, HttpResponseForbidden
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_protect
 from django.contrib.auth.decorators import login_required
+from evennia.accounts.models import AccountDB
 from evennia.objects.models import ObjectDB
-from .models import FamilyRelationship, RECIPROCAL_RELATIONSHIPS
+from evennia.typeclasses.attributes import Attribute
+from .models import FamilyRelationship, RECIPROCAL_RELATIONSHIPS, RELATIONSHIP_DISPLAY, get_full_names
+
+RELATIONSHIPS_PER_PAGE = 50
 
 
 def is_staff_user(user):
     """Check if user is Django staff or Evennia Builder+"""
     if user.is_staff:
         return True
-    if hasattr(user, 'account') and user.account:
-        return user.account.check_permstring("Builder")
-    return False
+    account = getattr(user, 'account', None)
+    return account is not None and account.check_permstring("Builder")
+
+
+def _full_name_prefetch():
+    """Prefetch characters' full_name attributes into full_name_attributes."""
+    return Prefetch(
+        'db_attributes',
+        queryset=Attribute.objects.filter(db_key='full_name', db_category__isnull=True),
+        to_attr='full_name_attributes',
+    )
+
+
+def _full_name(char):
+    """Read a full name loaded by _full_name_prefetch."""
+    return char.full_name_attributes[0].value if char.full_name_attributes else None
 
 
 @login_required
@@ -37,23 +56,27 @@ def character_search(request):
     # Limit query length for security
     query = query[:50]
     
-    # Search for characters (case-insensitive)
-    matched_ids = list(
+    # Search for characters (case-insensitive). Only the columns the response
+    # needs are read, as plain tuples, so no typeclassed objects are built
+    # (or left in the idmapper cache) for a keystroke lookup.
+    rows = list(
         ObjectDB.objects
         .filter(db_attributes__db_key='status', db_key__icontains=query)
         .exclude(db_attributes__db_value='gone')
         .order_by('db_key')
-        .values_list('id', flat=True)[:10]
+        .values_list('id', 'db_key', 'db_account_id')[:10]
     )
 
+    # Skip staff accounts, checking each account once
+    accounts = AccountDB.objects.in_bulk({account_id for _, _, account_id in rows if account_id})
+    builder_ids = {account_id for account_id, account in accounts.items() if account.check_permstring("Builder")}
+    full_names = get_full_names(char_id for char_id, _, _ in rows)
+
     results = []
-    for char in ObjectDB.objects.filter(id__in=matched_ids):
-        account = getattr(char, 'account', None)
-        if account and account.check_permstring("Builder"):
+    for char_id, key, account_id in rows:
+        if account_id in builder_ids:
             continue
-        full_name = getattr(char.db, 'full_name', None)
-        display_name = full_name or char.db_key
-        results.append({'id': char.id, 'name': char.db_key, 'display_name': display_name})
+        results.append({'id': char_id, 'name': key, 'display_name': full_names.get(char_id) or key})
 
     return JsonResponse(results, safe=False)
 
@@ -72,8 +95,8 @@ def get_character_name(request):
         return JsonResponse({'error': 'No character ID provided'}, status=400)
     
     try:
-        char = ObjectDB.objects.get(id=char_id)
-        display_name = char.db.full_name or char.db_key
+        char = ObjectDB.objects.prefetch_related(_full_name_prefetch()).get(id=char_id)
+        display_name = _full_name(char) or char.db_key
         return JsonResponse({
             'id': char.id,
             'name': char.db_key,
@@ -92,10 +115,14 @@ def relationship_list(request):
     # Check if user is staff
     if not is_staff_user(request.user):
         return HttpResponseForbidden("You must be staff to access family relationship management.")
-    relationships = FamilyRelationship.objects.all()
+    paginator = Paginator(FamilyRelationship.objects.all(), RELATIONSHIPS_PER_PAGE)
+    page = paginator.get_page(request.GET.get('page'))
+    relationships = FamilyRelationship.prime_name_cache(page.object_list)
 
     context = {
         'relationships': relationships,
+        'page_obj': page,
+        'paginator': paginator,
         'relationship_choices': FamilyRelationship._meta.get_field('relationship_type').choices,
     }
     
@@ -167,6 +194,8 @@ def add_relationship(request):
 
             if create_reciprocal and related_character_dbid and relationship_type in RECIPROCAL_RELATIONSHIPS:
                 reciprocal_type = RECIPROCAL_RELATIONSHIPS[relationship_type]
+                # Checked explicitly: unique_together includes the related
+                # name, so it can't catch legacy reciprocals that have one set
                 existing_reciprocal = FamilyRelationship.objects.filter(
                     character_id=related_character_dbid,
                     related_character_id=character_id,
@@ -201,13 +230,9 @@ def delete_relationship(request, relationship_id):
     relationship = get_object_or_404(FamilyRelationship, id=relationship_id)
     delete_reciprocal = request.POST.get('delete_reciprocal') == 'on'
     
-    # Get character names for messages
-    try:
-        char = ObjectDB.objects.get(id=relationship.character_id)
-        char_name = char.db.full_name or char.name
-    except ObjectDB.DoesNotExist:
-        char_name = f"Unknown (ID: {relationship.character_id})"
-    
+    # Get character names for messages, resolving both in one lookup
+    FamilyRelationship.prime_name_cache([relationship])
+    char_name = relationship.get_character_display_name()
     related_name = relationship.get_related_character_display_name()
     relationship_display = relationship.get_relationship_type_display()
     
@@ -240,18 +265,24 @@ def get_character_family(character_id):
     Utility function to get all family relationships for a character.
     Returns a dictionary organized by relationship type.
     """
-    relationships = FamilyRelationship.objects.filter(character_id=character_id)
+    relationships = FamilyRelationship.prime_name_cache(
+        FamilyRelationship.objects.filter(character_id=character_id)
+    )
+    # Load every related PC at once instead of one get per relative
+    related_objects = ObjectDB.objects.in_bulk(
+        {relationship.related_character_id for relationship in relationships if relationship.related_character_id}
+    )
     
     family_dict = {}
     for relationship in relationships:
-        rel_type = relationship.get_relationship_type_display()
+        rel_type = RELATIONSHIP_DISPLAY.get(relationship.relationship_type, relationship.relationship_type)
         if rel_type not in family_dict:
             family_dict[rel_type] = []
         
         family_member = {
             'name': relationship.get_related_character_display_name(),
             'is_pc': relationship.is_related_to_pc(),
-            'character_object': relationship.get_related_character_object()
+            'character_object': related_objects.get(relationship.related_character_id)
         }
         family_dict[rel_type].append(family_member)
     
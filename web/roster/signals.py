@@ -0,0 +1,91 @@
+"""
+Invalidation of the cached roster page.
+
+The roster's rendered character tables are cached under a version number.
+Changing anything the roster displays bumps the version, so the next
+request rebuilds the page instead of serving a stale copy.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_save, pre_delete
+from evennia.objects.models import ObjectDB
+from evennia.server.signals import SIGNAL_TYPED_OBJECT_POST_RENAME
+from evennia.typeclasses.attributes import Attribute
+
+ROSTER_VERSION_KEY = "roster:version"
+
+# Typeclasses of the objects shown on the roster (characters and the
+# organisations they are grouped under)
+ROSTER_TYPECLASSES = frozenset({
+    'typeclasses.characters.Character',
+    'typeclasses.organisations.Organisation',
+})
+
+# Attributes whose values appear on the roster page
+ROSTER_ATTRIBUTE_KEYS = frozenset({
+    'status',
+    'organisations',
+    'full_name',
+    'char_distinctions',
+    'rank_names',
+    'gender',
+    'age',
+    'realm',
+})
+
+
+def get_roster_version():
+    """Return the current roster cache version."""
+    return cache.get_or_set(ROSTER_VERSION_KEY, 1, None)
+
+
+def bump_roster_version():
+    """Invalidate every cached copy of the roster."""
+    cache.add(ROSTER_VERSION_KEY, 1, None)
+    cache.incr(ROSTER_VERSION_KEY)
+
+
+def _on_roster_object(attribute):
+    """Whether an attribute belongs to a character or organisation."""
+    return attribute.objectdb_set.filter(db_typeclass_path__in=ROSTER_TYPECLASSES).exists()
+
+
+def _attribute_saved(sender, instance, created=False, **kwargs):
+    # New attributes aren't linked to their object yet; _attributes_linked
+    # handles them once they are
+    if not created and instance.db_key in ROSTER_ATTRIBUTE_KEYS and _on_roster_object(instance):
+        bump_roster_version()
+
+
+def _attribute_deleting(sender, instance, **kwargs):
+    # Checked before deletion, while the attribute is still linked
+    if instance.db_key in ROSTER_ATTRIBUTE_KEYS and _on_roster_object(instance):
+        bump_roster_version()
+
+
+def _attributes_linked(sender, instance, action, pk_set=None, **kwargs):
+    if action != 'post_add' or not pk_set:
+        return
+    if not isinstance(instance, ObjectDB) or instance.db_typeclass_path not in ROSTER_TYPECLASSES:
+        return
+    if Attribute.objects.filter(pk__in=pk_set, db_key__in=ROSTER_ATTRIBUTE_KEYS).exists():
+        bump_roster_version()
+
+
+def _object_renamed(sender, **kwargs):
+    if getattr(sender, 'db_typeclass_path', None) in ROSTER_TYPECLASSES:
+        bump_roster_version()
+
+
+def connect_signals():
+    """Hook roster invalidation up to attribute and object changes."""
+    post_save.connect(_attribute_saved, sender=Attribute, dispatch_uid='roster_attribute_saved')
+    pre_delete.connect(_attribute_deleting, sender=Attribute, dispatch_uid='roster_attribute_deleting')
+    m2m_changed.connect(
+        _attributes_linked, sender=ObjectDB.db_attributes.through, dispatch_uid='roster_attributes_linked'
+    )
+    # Typeclassed objects are proxy models whose saves are sent with the
+    # typeclass as sender, so renames come from Evennia's own signal rather
+    # than post_save on ObjectDB. Deleted objects clear their attributes,
+    # which is caught above.
+    SIGNAL_TYPED_OBJECT_POST_RENAME.connect(_object_renamed, dispatch_uid='roster_object_renamed')
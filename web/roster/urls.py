@@ -5,9 +5,7 @@ from web.roster.views import (
     update_character_field,
     upload_character_image,
     delete_character_image,
-    set_main_character_image,
-    set_secondary_character_image,
-    set_tertiary_character_image,
+    set_character_image_slot,
     character_search_view
 )
 
@@ -20,7 +18,7 @@ urlpatterns = [
     path('detail/<str:char_name>/<int:char_id>/update/', update_character_field, name='update_character_field'),
     path('detail/<str:char_name>/<int:char_id>/upload-image/', upload_character_image, name='upload_character_image'),
     path('detail/<str:char_name>/<int:char_id>/delete-image/', delete_character_image, name='delete_character_image'),
-    path('detail/<str:char_name>/<int:char_id>/set-main-image/', set_main_character_image, name='set_main_character_image'),
-    path('detail/<str:char_name>/<int:char_id>/set-secondary-image/', set_secondary_character_image, name='set_secondary_character_image'),
-    path('detail/<str:char_name>/<int:char_id>/set-tertiary-image/', set_tertiary_character_image, name='set_tertiary_character_image'),
+    path('detail/<str:char_name>/<int:char_id>/set-main-image/', set_character_image_slot, {'slot': 'main'}, name='set_main_character_image'),
+    path('detail/<str:char_name>/<int:char_id>/set-secondary-image/', set_character_image_slot, {'slot': 'secondary'}, name='set_secondary_character_image'),
+    path('detail/<str:char_name>/<int:char_id>/set-tertiary-image/', set_character_image_slot, {'slot': 'tertiary'}, name='set_tertiary_character_image'),
 ] 
\ No newline at end of file
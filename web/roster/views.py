@@ -3,12 +3,17 @@ from django.http import JsonResponse
 from django.views.decorators.http import require_POST
 from django.views.decorators.csrf import csrf_protect
 from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
+from django.core.files.base import File
 from django.utils import timezone
+from django.utils.safestring import mark_safe
 from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.utils import make_template_fragment_key
 import os
 import uuid
 import io
+from dataclasses import dataclass
+from typing import Any
 from PIL import Image
 
 # Handle different Pillow versions
@@ -18,13 +23,27 @@ try:
 except ImportError:
     # Older Pillow versions
     LANCZOS = Image.LANCZOS
+from evennia.accounts.models import AccountDB
 from evennia.objects.models import ObjectDB
 from typeclasses.characters import STATUS_UNFINISHED, STATUS_AVAILABLE, STATUS_ACTIVE, STATUS_GONE
 from typeclasses.organisations import Organisation
+from .signals import get_roster_version
 import logging
 
 logger = logging.getLogger('web')
 
+# Seconds a rendered roster is kept; saves to roster data invalidate it sooner
+ROSTER_CACHE_TIMEOUT = 300
+
+@dataclass(frozen=True, slots=True)
+class RosterCharacter:
+    """The fields of a character shown in the roster tables (raw attribute values)."""
+    id: int
+    name: str
+    gender: Any = None
+    age: Any = None
+    realm: Any = None
+
 def is_staff_user(user):
     """
     Check if a user has staff privileges (either Django staff or Evennia Admin/Builder).
@@ -41,6 +60,18 @@ def is_staff_user(user):
     
     return user.is_staff or user.check_permstring("Admin") or user.check_permstring("Builder")
 
+def _attribute_values(obj_ids, key, category=None):
+    """
+    Load one attribute for many objects with a single query.
+    Returns a dict of object id -> value; objects without the attribute are left out.
+    """
+    links = ObjectDB.db_attributes.through.objects.filter(
+        objectdb_id__in=list(obj_ids),
+        attribute__db_key=key,
+        attribute__db_category=category,
+    ).select_related('attribute')
+    return {link.objectdb_id: link.attribute.value for link in links}
+
 def get_character_images(character):
     """
     Get all images for a character from their image_gallery attribute.
@@ -49,6 +80,16 @@ def get_character_images(character):
     gallery = character.attributes.get('image_gallery', default=[], category='gallery')
     return gallery
 
+def find_gallery_image(gallery, image_id):
+    """
+    Find an image in a gallery list by id.
+    Returns (position, image info), or (None, None) if it isn't there.
+    """
+    return next(
+        ((i, img) for i, img in enumerate(gallery) if img.get('id') == image_id),
+        (None, None)
+    )
+
 def validate_image_upload(image_file):
     """
     Check if uploaded file is a reasonable image before processing.
@@ -68,10 +109,8 @@ def validate_image_upload(image_file):
     
     return True
 
-def resize_image(image_file, max_size, good_quality=True):
-    """Simple resize. That's it."""
-    img = Image.open(image_file)
-    
+def _flatten_to_rgb(img):
+    """Convert an opened image to RGB, putting any transparency on white."""
     # Handle transparency properly - use white background instead of black
     if img.mode in ('RGBA', 'LA', 'P'):
         # Create a white background
@@ -82,7 +121,10 @@ def resize_image(image_file, max_size, good_quality=True):
         img = background
     elif img.mode != 'RGB':
         img = img.convert('RGB')
-    
+    return img
+
+def _encode_jpeg(img, max_size, good_quality=True):
+    """Shrink an RGB image in place to fit max_size and return it as a JPEG buffer."""
     # Resize it
     img.thumbnail((max_size, max_size), LANCZOS)
     
@@ -93,31 +135,48 @@ def resize_image(image_file, max_size, good_quality=True):
     buffer.seek(0)
     return buffer
 
-def save_character_image(character, image_file, caption=""):
+def resize_image(image_file, max_size, good_quality=True):
+    """Simple resize. That's it."""
+    return _encode_jpeg(_flatten_to_rgb(Image.open(image_file)), max_size, good_quality)
+
+def save_character_image(character, image_file, caption="", validated=False, existing_gallery=None):
     """
     Save an uploaded image to the character's gallery.
-    Creates full-size image (800px) and thumbnail (150px).
+    Creates full-size image (800px), gallery preview (400px) and thumbnail (150px).
+    Pass validated=True if validate_image_upload has already been run, and
+    existing_gallery if the caller has already loaded the gallery.
     Returns the image info dictionary.
     """
     # Validate upload first - catch problems early
-    validate_image_upload(image_file)
+    if not validated:
+        validate_image_upload(image_file)
     
     char_dir = f"character_images/{character.id}"
     image_id = str(uuid.uuid4())
     
     try:
+        # Decode the upload once; every size is cut from the same image
+        img = _flatten_to_rgb(Image.open(image_file))
+        
         # Create full-size image (800px, good quality)
-        full_buffer = resize_image(image_file, 800, good_quality=True)
+        full_buffer = _encode_jpeg(img, 800, good_quality=True)
         full_filename = f"{image_id}_full.jpg"
         full_path = f"{char_dir}/{full_filename}"
-        full_saved = default_storage.save(full_path, ContentFile(full_buffer.read()))
+        full_saved = default_storage.save(full_path, File(full_buffer, name=full_filename))
+        
+        # Create gallery preview (400px) so the gallery grid doesn't load
+        # full-size images. It and the thumbnail are shrunk from the previous
+        # size rather than decoding the upload again
+        preview_buffer = _encode_jpeg(img, 400, good_quality=False)
+        preview_filename = f"{image_id}_preview.jpg"
+        preview_path = f"{char_dir}/{preview_filename}"
+        preview_saved = default_storage.save(preview_path, File(preview_buffer, name=preview_filename))
         
         # Create thumbnail (150px, lower quality for smaller size)
-        image_file.seek(0)
-        thumb_buffer = resize_image(image_file, 150, good_quality=False)
+        thumb_buffer = _encode_jpeg(img, 150, good_quality=False)
         thumb_filename = f"{image_id}_thumb.jpg"
         thumb_path = f"{char_dir}/{thumb_filename}"
-        thumb_saved = default_storage.save(thumb_path, ContentFile(thumb_buffer.read()))
+        thumb_saved = default_storage.save(thumb_path, File(thumb_buffer, name=thumb_filename))
         
     except Exception as e:
         logger.error(f"Error saving character image: {e}")
@@ -128,50 +187,67 @@ def save_character_image(character, image_file, caption=""):
         'id': image_id,
         'filename': full_filename,
         'path': full_saved,
+        'preview_path': preview_saved,
         'thumbnail_path': thumb_saved,
         'caption': caption,
         'url': default_storage.url(full_saved) if hasattr(default_storage, 'url') else f"/media/{full_saved}",
+        'preview_url': default_storage.url(preview_saved) if hasattr(default_storage, 'url') else f"/media/{preview_saved}",
         'thumbnail_url': default_storage.url(thumb_saved) if hasattr(default_storage, 'url') else f"/media/{thumb_saved}",
         'uploaded_at': str(timezone.now())
     }
     
-    # Add to character's gallery
-    gallery = character.attributes.get('image_gallery', default=[], category='gallery')
-    gallery.append(image_info)
-    character.attributes.add('image_gallery', gallery, category='gallery')
+    # Add to character's gallery. Build a new list rather than appending:
+    # appending to the stored list saves it, and the add below would save again
+    if existing_gallery is None:
+        existing_gallery = character.attributes.get('image_gallery', default=[], category='gallery')
+    character.attributes.add('image_gallery', [*existing_gallery, image_info], category='gallery')
     
     return image_info
 
 def remove_character_image(character, image_id):
     """
     Delete an image from the character's gallery.
-    Removes both full-size image and thumbnail.
+    Removes the full-size image and its smaller copies.
     """
     gallery = character.attributes.get('image_gallery', default=[], category='gallery')
     
-    # Find and remove the image
-    for i, img in enumerate(gallery):
-        if img.get('id') == image_id:
-            # Delete the full-size image file
-            try:
-                if default_storage.exists(img['path']):
-                    default_storage.delete(img['path'])
-            except Exception as e:
-                logger.warning(f"Could not delete full-size image file {img['path']}: {e}")
-            
-            # Delete the thumbnail file if it exists
-            try:
-                if 'thumbnail_path' in img and default_storage.exists(img['thumbnail_path']):
-                    default_storage.delete(img['thumbnail_path'])
-            except Exception as e:
-                logger.warning(f"Could not delete thumbnail file {img.get('thumbnail_path', 'unknown')}: {e}")
-            
-            # Remove from gallery
-            gallery.pop(i)
-            character.attributes.add('image_gallery', gallery, category='gallery')
-            return True
+    # Find the image
+    i, img = find_gallery_image(gallery, image_id)
+    if img is None:
+        return False
     
-    return False
+    # Delete the full-size image and its smaller copies. Storage deletes are
+    # no-ops for missing files, so there's no need to check exists() first
+    # (older images have no preview, and the oldest no thumbnail)
+    for path_key in ('path', 'preview_path', 'thumbnail_path'):
+        path = img.get(path_key)
+        if not path:
+            continue
+        try:
+            default_storage.delete(path)
+        except Exception as e:
+            logger.warning(f"Could not delete image file {path}: {e}")
+    
+    # Remove from gallery with a single write (popping from the stored list
+    # would save it once, and the add again)
+    remaining = [entry for position, entry in enumerate(gallery) if position != i]
+    character.attributes.add('image_gallery', remaining, category='gallery')
+    return True
+
+def _trait_dice(handler):
+    """
+    Map each trait in a TraitHandler to its key and die for display,
+    keyed by the trait's name (falling back to its key).
+    """
+    # get() is served from the handler's already loaded trait data
+    traits = {}
+    for key in handler.all():
+        trait = handler.get(key)
+        traits[trait.name or key] = {
+            'key': key,
+            'value': f"d{int(trait.value)}"
+        }
+    return traits
 
 def roster_view(request):
     """
@@ -182,46 +258,89 @@ def roster_view(request):
     # Check if user is staff (either Django staff or Evennia Admin/Builder)
     is_staff = is_staff_user(request.user)
     
-    # Get characters by status (with attributes pre-loaded)
-    available_chars = ObjectDB.objects.filter(db_attributes__db_key='status', 
-                                           db_attributes__db_value=STATUS_AVAILABLE).prefetch_related('db_attributes').order_by('db_key')
-    active_chars = ObjectDB.objects.filter(db_attributes__db_key='status',
-                                        db_attributes__db_value=STATUS_ACTIVE).prefetch_related('db_attributes').order_by('db_key')
-    gone_chars = ObjectDB.objects.filter(db_attributes__db_key='status',
-                                      db_attributes__db_value=STATUS_GONE).prefetch_related('db_attributes').order_by('db_key')
-    
-    # Get unfinished characters (only if user is staff)
-    unfinished_chars = []
-    if is_staff:
-        unfinished_chars = ObjectDB.objects.filter(db_attributes__db_key='status',
-                                                db_attributes__db_value=STATUS_UNFINISHED).prefetch_related('db_attributes').order_by('db_key')
-    
-    # Filter out staff accounts
-    available_chars = [char for char in available_chars if not (char.account and char.account.check_permstring("Builder"))]
-    active_chars = [char for char in active_chars if not (char.account and char.account.check_permstring("Builder"))]
-    gone_chars = [char for char in gone_chars if not (char.account and char.account.check_permstring("Builder"))]
-    
-    # Filter unfinished characters too (only if we have them)
+    # Serve the cached character tables when nothing on them has changed
+    cache_context = {
+        'is_staff': is_staff,
+        'roster_version': get_roster_version(),
+        'roster_cache_timeout': ROSTER_CACHE_TIMEOUT,
+    }
+    fragment_key = make_template_fragment_key(
+        'roster_content', [is_staff, cache_context['roster_version']]
+    )
+    cached_roster = cache.get(fragment_key)
+    if cached_roster is not None:
+        return render(request, 'roster/roster.html', {**cache_context, 'cached_roster': mark_safe(cached_roster)})
+    
+    # Get every listed character in one query, then split them by status
+    shown_statuses = [STATUS_AVAILABLE, STATUS_ACTIVE, STATUS_GONE]
     if is_staff:
-        unfinished_chars = [char for char in unfinished_chars if not (char.account and char.account.check_permstring("Builder"))]
+        # Unfinished characters are only shown to staff
+        shown_statuses.append(STATUS_UNFINISHED)
+    # Plain (id, key, account) rows: the roster never needs the full objects
+    roster_rows = list(
+        ObjectDB.objects.filter(db_attributes__db_key='status',
+                                db_attributes__db_value__in=shown_statuses)
+        .order_by('db_key')
+        .values_list('id', 'db_key', 'db_account_id')
+    )
+    
+    # Filter out staff accounts, checking each account once
+    accounts = AccountDB.objects.in_bulk({account_id for _, _, account_id in roster_rows if account_id})
+    builder_ids = {account_id for account_id, account in accounts.items() if account.check_permstring("Builder")}
+    roster_rows = [(char_id, key) for char_id, key, account_id in roster_rows if account_id not in builder_ids]
+    
+    # Load the attributes the roster needs for every listed character at once,
+    # rather than one attribute lookup per character
+    char_ids = [char_id for char_id, _ in roster_rows]
+    statuses = _attribute_values(char_ids, 'status')
+    genders = _attribute_values(char_ids, 'gender')
+    ages = _attribute_values(char_ids, 'age')
+    realms = _attribute_values(char_ids, 'realm')
+    
+    chars_by_status = {status: [] for status in shown_statuses}
+    for char_id, key in roster_rows:
+        bucket = chars_by_status.get(statuses.get(char_id))
+        if bucket is not None:
+            bucket.append(RosterCharacter(
+                id=char_id,
+                name=key,
+                gender=genders.get(char_id),
+                age=ages.get(char_id),
+                realm=realms.get(char_id),
+            ))
+    
+    available_chars = chars_by_status[STATUS_AVAILABLE]
+    active_chars = chars_by_status[STATUS_ACTIVE]
+    gone_chars = chars_by_status[STATUS_GONE]
+    unfinished_chars = chars_by_status.get(STATUS_UNFINISHED, [])
     
     # Get all organizations
-    organizations = ObjectDB.objects.filter(db_typeclass_path='typeclasses.organisations.Organisation').order_by('db_key')
+    organizations = list(ObjectDB.objects.filter(db_typeclass_path='typeclasses.organisations.Organisation').order_by('db_key'))
     
+    # Read each organization's rank names once, not once per member
+    loaded_rank_names = _attribute_values([org.id for org in organizations], 'rank_names')
+    rank_names_by_org = {org.id: loaded_rank_names.get(org.id) or {} for org in organizations}
+    
+    orgs_by_char = _attribute_values(char_ids, 'organisations', category='organisations')
+    full_names = _attribute_values(char_ids, 'full_name')
+    # Raw TraitHandler data for the distinctions handler: {trait_key: {"name": ..., ...}}
+    distinctions_by_char = _attribute_values(char_ids, 'char_distinctions', category='traits')
+
     # Helper function to get concept
     def get_concept(char):
-        try:
-            if hasattr(char, 'distinctions'):
-                concept = char.distinctions.get("concept")
-                if concept:
-                    return concept.name
-        except Exception:
-            pass
-        return "No concept set"
+        concept = (distinctions_by_char.get(char.id) or {}).get('concept')
+        return (concept and concept.get('name')) or "No concept set"
 
     # Helper function to get display name
     def get_display_name(char):
-        return char.db.full_name or char.name
+        return full_names.get(char.id) or char.name
+
+    # Build each character's (char, concept, display name) row once; it is
+    # shown both in the status lists and in every organization they belong to
+    char_rows = {
+        char.id: (char, get_concept(char), get_display_name(char))
+        for char in available_chars + active_chars + gone_chars + unfinished_chars
+    }
 
     # Build organization data efficiently - loop through characters once
     org_data = {status: [] for status in ['available', 'active', 'gone']}
@@ -246,16 +365,13 @@ def roster_view(request):
         for char in char_list:
             try:
                 # Get character's organizations once
-                char_orgs = char.attributes.get('organisations', default={}, category='organisations')
+                char_orgs = orgs_by_char.get(char.id) or {}
                 
                 for org_id, rank in char_orgs.items():
                     if org_id in org_buckets[status]:
-                        # Find the org object for rank names
-                        org = next((o for o in organizations if o.id == org_id), None)
-                        if org:
-                            rank_name = org.db.rank_names.get(rank, f"Rank {rank}")
-                            char_data = (char, get_concept(char), get_display_name(char), rank_name)
-                            org_buckets[status][org_id].append((char_data, rank))
+                        rank_name = rank_names_by_org[org_id].get(rank, f"Rank {rank}")
+                        char_data = char_rows[char.id] + (rank_name,)
+                        org_buckets[status][org_id].append((char_data, rank))
             except Exception:
                 continue
     
@@ -265,23 +381,23 @@ def roster_view(request):
         for org in organizations:
             if org_buckets[status][org.id]:
                 # Sort by rank then name
-                sorted_chars = sorted(org_buckets[status][org.id], key=lambda x: (x[1], x[0][0].key.lower()))
+                sorted_chars = sorted(org_buckets[status][org.id], key=lambda x: (x[1], x[0][0].name.lower()))
                 char_tuples = [char_data for char_data, rank in sorted_chars]
                 status_orgs.append((org, char_tuples))
         org_data[status] = status_orgs
 
     # Prepare context with character data
     context = {
-        'available_chars': [(char, get_concept(char), get_display_name(char)) for char in available_chars],
-        'active_chars': [(char, get_concept(char), get_display_name(char)) for char in active_chars],
-        'gone_chars': [(char, get_concept(char), get_display_name(char)) for char in gone_chars],
+        'available_chars': [char_rows[char.id] for char in available_chars],
+        'active_chars': [char_rows[char.id] for char in active_chars],
+        'gone_chars': [char_rows[char.id] for char in gone_chars],
         'organizations': org_data,
-        'is_staff': is_staff
+        **cache_context,
     }
     
     # Add unfinished characters if user is staff
     if is_staff:
-        context['unfinished_chars'] = [(char, get_concept(char), get_display_name(char)) for char in unfinished_chars]
+        context['unfinished_chars'] = [char_rows[char.id] for char in unfinished_chars]
     
     return render(request, 'roster/roster.html', context)
 
@@ -297,16 +413,21 @@ def character_detail_view(request, char_name, char_id):
     # Since account names match character names, check username against character name
     can_see_traits = is_staff_user(request.user) or (request.user.username.lower() == character.name.lower())
     
+    # Look up each named distinction once
+    concept = character.distinctions.get('concept')
+    culture = character.distinctions.get('culture')
+    vocation = character.distinctions.get('vocation')
+    
     # Get character's basic info
     basic_info = {
         'name': character.db.full_name or character.name,
-        'concept': character.distinctions.get('concept').name if character.distinctions.get('concept') else None,
+        'concept': concept.name if concept else None,
         'gender': character.db.gender,
         'age': character.db.age,
         'birthday': character.db.birthday,
         'realm': character.db.realm,
-        'culture': character.distinctions.get('culture').name if character.distinctions.get('culture') else None,
-        'vocation': character.distinctions.get('vocation').name if character.distinctions.get('vocation') else None,
+        'culture': culture.name if culture else None,
+        'vocation': vocation.name if vocation else None,
         'notable_traits': character.db.notable_traits,
         'description': character.db.desc,
         'background': character.db.background,
@@ -315,18 +436,20 @@ def character_detail_view(request, char_name, char_id):
         'secret_information': character.db.secret_information,
     }
     
-    # Get character's organizations
+    # Get character's organizations, loading the orgs and their rank names in bulk
+    char_orgs = character.organisations
+    orgs = ObjectDB.objects.in_bulk(list(char_orgs))
+    rank_names_by_org = _attribute_values(orgs, 'rank_names')
     organizations = []
-    for org_id, rank in character.organisations.items():
-        try:
-            org = ObjectDB.objects.get(id=org_id)
-            rank_name = org.db.rank_names.get(rank, f"Rank {rank}")
-            organizations.append({
-                'name': org.name,
-                'rank': rank_name
-            })
-        except ObjectDB.DoesNotExist:
+    for org_id, rank in char_orgs.items():
+        org = orgs.get(org_id)
+        if not org:
             continue
+        rank_names = rank_names_by_org.get(org_id) or {}
+        organizations.append({
+            'name': org.name,
+            'rank': rank_names.get(rank, f"Rank {rank}")
+        })
     
     # Get character's image gallery
     gallery_images = get_character_images(character)
@@ -347,32 +470,10 @@ def character_detail_view(request, char_name, char_id):
     
     # Only include traits if user has permission
     if can_see_traits:
-        # Get character's distinctions
-        distinctions = {}
-        for key in character.distinctions.all():
-            trait = character.distinctions.get(key)
-            distinctions[trait.name or key] = {
-                'key': key,
-                'value': f"d{int(trait.value)}"
-            }
-        
-        # Get character's attributes
-        attributes = {}
-        for key in character.character_attributes.all():
-            trait = character.character_attributes.get(key)
-            attributes[trait.name or key] = {
-                'key': key,
-                'value': f"d{int(trait.value)}"
-            }
-        
-        # Get character's skills
-        skills = {}
-        for key in character.skills.all():
-            trait = character.skills.get(key)
-            skills[trait.name or key] = {
-                'key': key,
-                'value': f"d{int(trait.value)}"
-            }
+        # Get character's distinctions, attributes and skills
+        distinctions = _trait_dice(character.distinctions)
+        attributes = _trait_dice(character.character_attributes)
+        skills = _trait_dice(character.skills)
         
         # Get character's signature assets
         signature_assets = {}
@@ -579,7 +680,9 @@ def upload_character_image(request, char_name, char_id):
             return JsonResponse({'error': 'Maximum of 20 images per character allowed'}, status=400)
         
         # Save the image
-        image_info = save_character_image(character, image_file, caption)
+        image_info = save_character_image(
+            character, image_file, caption, validated=True, existing_gallery=current_gallery
+        )
         
         logger.info(f"Uploaded image for {char_name}: {image_info['filename']}")
         
@@ -634,112 +737,23 @@ def delete_character_image(request, char_name, char_id):
             'message': 'Server error occurred'
         }, status=500)
 
-@require_POST
-@csrf_protect
-def set_main_character_image(request, char_name, char_id):
-    """
-    API endpoint to set a gallery image as the main character image.
-    Only accessible by staff members or the character owner.
-    """
-    try:
-        character = get_object_or_404(ObjectDB, id=char_id, db_key__iexact=char_name)
-        
-        # Check permissions (staff or character owner)
-        can_edit = is_staff_user(request.user) or (request.user.username.lower() == character.name.lower())
-        if not can_edit:
-            return JsonResponse({'error': 'Permission denied'}, status=403)
-        
-        image_id = request.POST.get('image_id')
-        if not image_id:
-            return JsonResponse({'error': 'No image ID provided'}, status=400)
-        
-        # Find the image in the gallery
-        gallery = character.attributes.get('image_gallery', default=[], category='gallery')
-        selected_image = None
-        
-        for img in gallery:
-            if img.get('id') == image_id:
-                selected_image = img
-                break
-        
-        if not selected_image:
-            return JsonResponse({'error': 'Image not found in gallery'}, status=404)
-        
-        # Set the image as the main character image
-        character.db.image_url = selected_image['url']
-        
-        logger.info(f"Set main image for {char_name} to: {selected_image['filename']}")
-        
-        return JsonResponse({
-            'success': True,
-            'image_url': selected_image['url'],
-            'message': 'Main image updated successfully'
-        })
-        
-    except Exception as e:
-        logger.error(f"Error setting main character image: {str(e)}")
-        return JsonResponse({
-            'error': str(e),
-            'message': 'Server error occurred'
-        }, status=500)
-
-@require_POST
-@csrf_protect
-def set_secondary_character_image(request, char_name, char_id):
-    """
-    API endpoint to set a gallery image as the secondary character image.
-    Only accessible by staff members or the character owner.
-    """
-    try:
-        character = get_object_or_404(ObjectDB, id=char_id, db_key__iexact=char_name)
-        
-        # Check permissions (staff or character owner)
-        can_edit = is_staff_user(request.user) or (request.user.username.lower() == character.name.lower())
-        if not can_edit:
-            return JsonResponse({'error': 'Permission denied'}, status=403)
-        
-        image_id = request.POST.get('image_id')
-        if not image_id:
-            return JsonResponse({'error': 'No image ID provided'}, status=400)
-        
-        # Find the image in the gallery
-        gallery = character.attributes.get('image_gallery', default=[], category='gallery')
-        selected_image = None
-        
-        for img in gallery:
-            if img.get('id') == image_id:
-                selected_image = img
-                break
-        
-        if not selected_image:
-            return JsonResponse({'error': 'Image not found in gallery'}, status=404)
-        
-        # Set the image as the secondary character image
-        character.db.secondary_image_url = selected_image['url']
-        
-        logger.info(f"Set secondary image for {char_name} to: {selected_image['filename']}")
-        
-        return JsonResponse({
-            'success': True,
-            'image_url': selected_image['url'],
-            'message': 'Secondary image updated successfully'
-        })
-        
-    except Exception as e:
-        logger.error(f"Error setting secondary character image: {str(e)}")
-        return JsonResponse({
-            'error': str(e),
-            'message': 'Server error occurred'
-        }, status=500)
+# Gallery image slots and the character attribute each one sets
+IMAGE_SLOT_ATTRIBUTES = {
+    'main': 'image_url',
+    'secondary': 'secondary_image_url',
+    'tertiary': 'tertiary_image_url',
+}
 
 @require_POST
 @csrf_protect
-def set_tertiary_character_image(request, char_name, char_id):
+def set_character_image_slot(request, char_name, char_id, slot):
     """
-    API endpoint to set a gallery image as the tertiary character image.
+    API endpoint to set a gallery image as the character's main, secondary
+    or tertiary image (chosen by the URL's slot).
     Only accessible by staff members or the character owner.
     """
     try:
+        attribute = IMAGE_SLOT_ATTRIBUTES[slot]
         character = get_object_or_404(ObjectDB, id=char_id, db_key__iexact=char_name)
         
         # Check permissions (staff or character owner)
@@ -753,29 +767,24 @@ def set_tertiary_character_image(request, char_name, char_id):
         
         # Find the image in the gallery
         gallery = character.attributes.get('image_gallery', default=[], category='gallery')
-        selected_image = None
-        
-        for img in gallery:
-            if img.get('id') == image_id:
-                selected_image = img
-                break
+        _, selected_image = find_gallery_image(gallery, image_id)
         
         if not selected_image:
             return JsonResponse({'error': 'Image not found in gallery'}, status=404)
         
-        # Set the image as the tertiary character image
-        character.db.tertiary_image_url = selected_image['url']
+        # Set the image as the character's image for this slot
+        character.attributes.add(attribute, selected_image['url'])
         
-        logger.info(f"Set tertiary image for {char_name} to: {selected_image['filename']}")
+        logger.info(f"Set {slot} image for {char_name} to: {selected_image['filename']}")
         
         return JsonResponse({
             'success': True,
             'image_url': selected_image['url'],
-            'message': 'Tertiary image updated successfully'
+            'message': f'{slot.capitalize()} image updated successfully'
         })
         
     except Exception as e:
-        logger.error(f"Error setting tertiary character image: {str(e)}")
+        logger.error(f"Error setting {slot} character image: {str(e)}")
         return JsonResponse({
             'error': str(e),
             'message': 'Server error occurred'
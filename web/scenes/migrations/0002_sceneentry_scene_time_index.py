@@ -0,0 +1,17 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scenes", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="sceneentry",
+            index=models.Index(
+                fields=["scene", "created_at", "sequence"], name="scenes_entry_scene_time_idx"
+            ),
+        ),
+    ]
@@ -128,12 +128,13 @@ class SceneEntry(models.Model):
         indexes = [
             models.Index(fields=["scene", "sequence"]),
             models.Index(fields=["scene", "entry_type"]),
+            models.Index(fields=["scene", "created_at", "sequence"], name="scenes_entry_scene_time_idx"),
         ]
 
     def save(self, *args, **kwargs):
         if self.sequence is None:
-            last_sequence = (
-                SceneEntry.objects.filter(scene=self.scene).order_by("-sequence").values_list("sequence", flat=True).first()
-            )
+            last_sequence = SceneEntry.objects.filter(scene=self.scene).aggregate(
+                last=models.Max("sequence")
+            )["last"]
             self.sequence = (last_sequence or 0) + 1
         super().save(*args, **kwargs)